@@ -0,0 +1,79 @@
+"""Count script runs and render time for common app interactions.
+
+Drives the app with Streamlit's AppTest on a synthetic report and reads the counters
+kept by ixl_grader.ui.session.updater.track_render. AppTest reruns the whole script
+even for widgets inside fragments. Usage: python benchmarks/interactions.py [ROWS]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from synthetic import make_export
+
+ROOT = Path(__file__).resolve().parent.parent
+MAIN_SCRIPT = ROOT / "src" / "scripts" / "main.py"
+
+
+class _UploadedFile:
+    """Stands in for the uploaded report, which AppTest cannot upload itself."""
+
+    name = "report.csv"
+
+    def __init__(self, data: bytes):
+        self._data = data
+
+    def getvalue(self) -> bytes:
+        return self._data
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    # Keep overrides set by the benchmark out of the real local storage
+    os.environ["HOME"] = tempfile.mkdtemp()
+
+    from streamlit.testing.v1 import AppTest
+
+    from ixl_grader.core.report import Report
+
+    data = make_export(rows)
+    report = Report()
+    report.import_report(data)
+
+    app = AppTest.from_file(str(MAIN_SCRIPT), default_timeout=120)
+    app.session_state["uploaded_file"] = _UploadedFile(data)
+    app.session_state["report"] = report
+    app.session_state["is_gradable"] = True
+
+    def set_override():
+        app.text_input(key="override_student_id").input("1000001")
+        app.number_input(key="override_minimum").set_value(65)
+        return next(b for b in app.button if b.label == "Set Override").click()
+
+    interactions = [
+        ("first render", lambda: app),
+        ("grade", lambda: app.button(key="grade_button").click()),
+        ("threshold slider", lambda: app.slider(key="smart_score_threshold_slider").set_value(60)),
+        ("set override", set_override),
+        ("toggle help", lambda: app.button(key="overrides_help_btn").click()),
+    ]
+
+    print(f"{'interaction':>18} {'runs':>5} {'render s':>9} {'wall s':>8}")
+    for name, interact in interactions:
+        start = time.perf_counter()
+        interact().run()
+        wall_seconds = time.perf_counter() - start
+        assert not app.exception, app.exception
+
+        stats = app.session_state["render_stats"]
+        print(
+            f"{name:>18} {stats['last_interaction_runs']:>5} "
+            f"{stats['last_interaction_seconds']:>9.3f} {wall_seconds:>8.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Compare CSV parse throughput of the available parser engines on synthetic IXL exports.
+
+Usage: python benchmarks/parser_engines.py [ROWS ...]
+"""
+
+import io
+import sys
+import time
+
+from ixl_grader.core.parsing import HAS_PYARROW, read_csv
+from ixl_grader.core.report import Report
+from synthetic import make_export
+
+
+def time_parse(data: bytes, engine: str, repeats: int = 3) -> float:
+    """Best-of-repeats seconds to parse the CSV alone, as Report does after repair."""
+    # Synthetic exports have malformed rows, which only parse once repaired
+    data = Report()._fix_csv(data).getvalue()
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        read_csv(io.BytesIO(data), engine=engine, text_columns=["Student ID"])
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def time_import(data: bytes, engine: str, repeats: int = 3) -> float:
+    """Best-of-repeats seconds for a full import (repair, parse and clean)."""
+    best = float("inf")
+    for _ in range(repeats):
+        report = Report(parser_engine=engine)
+        start = time.perf_counter()
+        report.import_report(io.BytesIO(data))
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    engines = ["c", "pyarrow"] if HAS_PYARROW else ["c"]
+
+    print(f"{'rows':>10} {'engine':>8} {'parse rows/s':>14} {'import rows/s':>14}")
+    for rows in sizes:
+        data = make_export(rows)
+        for engine in engines:
+            parse_seconds = time_parse(data, engine)
+            import_seconds = time_import(data, engine)
+            print(
+                f"{rows:>10} {engine:>8} {rows / parse_seconds:>14,.0f} "
+                f"{rows / import_seconds:>14,.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+"""Time and memory-profile each stage of importing, grading and exporting a report.
+
+Runs the Report and StudentOverrides stages one after another on synthetic IXL exports
+from synthetic.py: CSV repair (_fix_csv), parsing (_load_report), ID cleaning
+(_clean_ids), override import and lookup, grading and export. Stage times are the best
+of several runs; peak and retained memory come from a separate run under tracemalloc,
+which sees NumPy and pandas allocations but not pyarrow's. Results are printed as a
+table and can be written as JSON to compare against a baseline from an earlier run.
+
+Usage: python benchmarks/pipeline.py [SIZE ...] [--json PATH] [--baseline PATH]
+where SIZE is one of the names in synthetic.SIZES or a row count (default: 1k 100k 1m).
+"""
+
+import argparse
+import io
+import json
+import platform
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from ixl_grader.core.parsing import HAS_PYARROW
+from ixl_grader.core.report import Report
+from ixl_grader.core.student_overrides import StudentOverrides
+from synthetic import SIZES, make_export, make_overrides, resolve_size
+
+STAGES = [
+    "fix_csv",
+    "load_report",
+    "clean_ids",
+    "import_overrides",
+    "lookup_overrides",
+    "grade",
+    "export_report",
+]
+
+DEFAULT_SIZES = ["1k", "100k", "1m"]
+SMART_SCORE_THRESHOLD = 80
+
+# Stage changes smaller than this fraction of the baseline are shown as unchanged
+NOISE_FRACTION = 0.05
+
+
+def pipeline_stages(
+    data: bytes, overrides_data: bytes
+) -> tuple[Report, list[tuple[str, Callable[[], None]]]]:
+    """Build a fresh report and the stages of one end-to-end run, in STAGES order.
+
+    Each stage works on the output of the one before, so they must be run in order.
+    """
+    overrides = StudentOverrides(persist=False)
+    report = Report(student_overrides=overrides)
+    state = {}
+
+    def fix_csv():
+        state["buffer"] = report._fix_csv(data)
+
+    def load_report():
+        report._report = report._load_report(state.pop("buffer"))
+
+    def clean_ids():
+        report._clean_report()
+
+    def import_overrides():
+        overrides.import_overrides(overrides_data)
+
+    def lookup_overrides():
+        student_ids = report.view(["Student ID"])["Student ID"]
+        overrides.get_overrides(student_ids, normalized=True)
+
+    def grade():
+        report.grade(SMART_SCORE_THRESHOLD)
+
+    def export_report():
+        report.export_report(io.StringIO())
+
+    stages = [
+        fix_csv, load_report, clean_ids, import_overrides, lookup_overrides, grade, export_report
+    ]
+    return report, [(stage.__name__, stage) for stage in stages]
+
+
+def time_stages(
+    data: bytes, overrides_data: bytes, repeats: int
+) -> tuple[Report, dict[str, float]]:
+    """Best-of-repeats seconds for each stage, and the report from the last run."""
+    best = dict.fromkeys(STAGES, float("inf"))
+    for _ in range(repeats):
+        report, stages = pipeline_stages(data, overrides_data)
+        for stage, run in stages:
+            start = time.perf_counter()
+            run()
+            best[stage] = min(best[stage], time.perf_counter() - start)
+    return report, best
+
+
+def profile_stages(data: bytes, overrides_data: bytes) -> dict[str, tuple[int, int]]:
+    """Peak bytes allocated during each stage, and bytes still held after it."""
+    memory = {}
+    _, stages = pipeline_stages(data, overrides_data)
+    tracemalloc.start()
+    try:
+        for stage, run in stages:
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            run()
+            after, peak = tracemalloc.get_traced_memory()
+            memory[stage] = (peak - before, after - before)
+    finally:
+        tracemalloc.stop()
+    return memory
+
+
+def benchmark(size: str, repeats: int, profile_memory: bool) -> dict:
+    """Run every stage on a synthetic export of the given size.
+
+    Throughput is in report rows per second for every stage, including the override ones.
+    """
+    rows = resolve_size(size)
+    data = make_export(rows)
+    overrides_data = make_overrides(rows)
+
+    report, seconds = time_stages(data, overrides_data, repeats)
+    memory = profile_stages(data, overrides_data) if profile_memory else {}
+
+    results = {}
+    for stage in STAGES:
+        results[stage] = {
+            "seconds": seconds[stage],
+            "rows_per_second": rows / seconds[stage] if seconds[stage] else None,
+        }
+        if stage in memory:
+            results[stage]["peak_bytes"], results[stage]["retained_bytes"] = memory[stage]
+
+    return {
+        "size": size,
+        "rows": rows,
+        "input_bytes": len(data),
+        "rows_repaired": report.get_rows_repaired(),
+        "overrides": report.get_student_overrides().get_page(page_size=1)[1],
+        "stages": results,
+    }
+
+
+def environment() -> dict:
+    """Versions and settings that affect the results."""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "pyarrow": HAS_PYARROW,
+        "threshold": SMART_SCORE_THRESHOLD,
+    }
+
+
+def print_run(run: dict, baseline: dict | None) -> None:
+    print(
+        f"\n{run['size']}: {run['rows']:,} rows, {run['input_bytes'] / 1e6:,.1f} MB, "
+        f"{run['rows_repaired']:,} repaired, {run['overrides']:,} overrides"
+    )
+    print(
+        f"{'stage':>18} {'seconds':>9} {'rows/s':>13} {'peak MB':>9} {'kept MB':>9}  change"
+    )
+    for stage, result in run["stages"].items():
+        peak = result.get("peak_bytes")
+        kept = result.get("retained_bytes")
+        print(
+            f"{stage:>18} {result['seconds']:>9.4f} {result['rows_per_second'] or 0:>13,.0f} "
+            f"{'-' if peak is None else f'{peak / 1e6:.1f}':>9} "
+            f"{'-' if kept is None else f'{kept / 1e6:.1f}':>9}  "
+            f"{_change(result, (baseline or {}).get(stage))}"
+        )
+
+
+def _change(result: dict, baseline: dict | None) -> str:
+    if not baseline:
+        return ""
+    change = result["seconds"] / baseline["seconds"] - 1
+    if abs(change) < NOISE_FRACTION:
+        return "~"
+    return f"{change:+.0%}"
+
+
+def _baseline_stages(path: Path) -> dict[tuple[str, int], dict]:
+    runs = json.loads(path.read_text())["runs"]
+    return {(run["size"], run["rows"]): run["stages"] for run in runs}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "sizes", nargs="*", default=DEFAULT_SIZES, help=f"{', '.join(SIZES)} or a row count"
+    )
+    parser.add_argument("--repeats", type=int, default=3, help="timed runs per size")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("--json", type=Path, help="write the results to this file")
+    parser.add_argument(
+        "--baseline", type=Path, help="compare times with an earlier --json file"
+    )
+    args = parser.parse_args()
+
+    baselines = _baseline_stages(args.baseline) if args.baseline else {}
+    runs = []
+    for size in args.sizes:
+        run = benchmark(size, args.repeats, not args.no_memory)
+        print_run(run, baselines.get((run["size"], run["rows"])))
+        runs.append(run)
+
+    if args.json:
+        results = {"environment": environment(), "runs": runs}
+        args.json.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Measure app startup: package import time and time to the first rendered page.
+
+Each sample runs in a fresh interpreter with an empty home directory, like a cold
+container start. Usage: python benchmarks/startup.py [REPEATS]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+MAIN_SCRIPT = ROOT / "src" / "scripts" / "main.py"
+
+# Modules whose presence after startup shows what was loaded eagerly
+HEAVY_MODULES = ["pandas", "numpy", "pyarrow", "ixl_grader.core.report"]
+
+IMPORT_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import ixl_grader.ui
+seconds = time.perf_counter() - start
+print(json.dumps({"seconds": seconds, "loaded": [m for m in %r if m in sys.modules]}))
+""" % (HEAVY_MODULES,)
+
+RENDER_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file(%r, default_timeout=60).run()
+seconds = time.perf_counter() - start
+assert not app.exception, app.exception
+print(json.dumps({"seconds": seconds, "loaded": [m for m in %r if m in sys.modules]}))
+""" % (str(MAIN_SCRIPT), HEAVY_MODULES)
+
+
+def run_probe(probe: str) -> dict:
+    """Run a probe in a fresh interpreter and return its JSON result."""
+    with tempfile.TemporaryDirectory() as home:
+        env = dict(os.environ, HOME=home)
+        env["PYTHONPATH"] = os.pathsep.join(
+            filter(None, [str(ROOT / "src"), env.get("PYTHONPATH")])
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", probe], env=env, capture_output=True, text=True, check=True
+        )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def measure(probe: str, repeats: int) -> tuple[float, list[str]]:
+    """Median seconds over repeats, and the heavy modules the probe loaded."""
+    results = [run_probe(probe) for _ in range(repeats)]
+    return statistics.median(r["seconds"] for r in results), results[-1]["loaded"]
+
+
+def main() -> None:
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    print(f"{'stage':>16} {'median s':>10}  heavy modules loaded")
+    for stage, probe in [("import", IMPORT_PROBE), ("first render", RENDER_PROBE)]:
+        seconds, loaded = measure(probe, repeats)
+        print(f"{stage:>16} {seconds:>10.3f}  {', '.join(loaded) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""Generate synthetic IXL exports and matching student override files.
+
+Exports have one row per student and skill, with the quirks seen in real IXL files:
+Student IDs with and without the "ID" prefix, missing SmartScores, and rows whose
+names contain unquoted commas, which leave them with more columns than the header.
+Files are written a chunk at a time, so even the largest size needs little memory.
+
+Usage: python benchmarks/synthetic.py OUTPUT_DIR [SIZE ...]
+where SIZE is one of the names in SIZES or a row count (default: all of SIZES).
+"""
+
+import io
+import sys
+from pathlib import Path
+from typing import BinaryIO
+
+import numpy as np
+
+# Named benchmark sizes and their row counts
+SIZES = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000, "10m": 10_000_000}
+
+EXPORT_HEADER = "Student ID,Last name,First name,Skill,SmartScore\n"
+OVERRIDES_HEADER = "Student ID,Smart Score Threshold,Minimum Grade\n"
+
+# Each student has a row for every skill
+SKILLS_PER_STUDENT = 20
+
+# Fraction of students whose IDs are written as "ID0123456" instead of "0123456"
+PREFIXED_ID_RATE = 0.5
+# Fraction of rows with a blank SmartScore (skills not yet practiced)
+MISSING_SCORE_RATE = 0.2
+# Fraction of students whose last name has an unquoted comma, malforming all their rows
+MALFORMED_NAME_RATE = 0.01
+# Fraction of students with an override, and of those, how often each value is left blank
+OVERRIDE_RATE = 0.05
+OVERRIDE_BLANK_RATE = 0.25
+
+# Rows generated and written at a time
+WRITE_CHUNK_ROWS = 100_000
+
+_LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+    "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson",
+    "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Lee", "Nguyen", "O'Brien",
+]
+_FIRST_NAMES = [
+    "Olivia", "Liam", "Emma", "Noah", "Amelia", "Oliver", "Ava", "Elijah", "Sophia",
+    "Mateo", "Isabella", "Lucas", "Mia", "Levi", "Chloé", "José", "Zoë", "Aarav",
+]
+# Written after the last name with an unquoted comma, as IXL does
+_NAME_SUFFIXES = ["Jr.", "Sr.", "III", ""]
+
+
+def resolve_size(size: str) -> int:
+    """Get the row count for a size name from SIZES or a plain row count."""
+    if size.lower() in SIZES:
+        return SIZES[size.lower()]
+    return int(size.replace("_", ""))
+
+
+def student_count(rows: int) -> int:
+    """Get the number of students in an export of the given number of rows."""
+    return -(-rows // SKILLS_PER_STUDENT)
+
+
+def _student_ids(students: int, seed: int) -> list[str]:
+    rng = np.random.default_rng([seed, 1])
+    prefixed = rng.random(students) < PREFIXED_ID_RATE
+    return [
+        f"ID{1000000 + student}" if prefix else str(1000000 + student)
+        for student, prefix in zip(range(students), prefixed)
+    ]
+
+
+def _student_prefixes(students: int, seed: int) -> tuple[list[str], np.ndarray]:
+    """Build each student's "ID,last,first," row prefix, and flag the malformed ones."""
+    rng = np.random.default_rng([seed, 2])
+    last_names = rng.integers(len(_LAST_NAMES), size=students)
+    first_names = rng.integers(len(_FIRST_NAMES), size=students)
+    malformed = rng.random(students) < MALFORMED_NAME_RATE
+    suffixes = rng.integers(len(_NAME_SUFFIXES), size=students)
+
+    prefixes = []
+    for student_id, last, first, is_malformed, suffix in zip(
+        _student_ids(students, seed), last_names, first_names, malformed, suffixes
+    ):
+        last_name = _LAST_NAMES[last]
+        if is_malformed:
+            # "Smith, Jr." splits the name in two; "Smith," leaves a blank cell after it
+            last_name += f", {_NAME_SUFFIXES[suffix]}" if _NAME_SUFFIXES[suffix] else ","
+        prefixes.append(f"{student_id},{last_name},{_FIRST_NAMES[first]},")
+    return prefixes, malformed
+
+
+def write_export(output: BinaryIO, rows: int, seed: int = 0) -> int:
+    """Write a synthetic IXL export of the given number of rows to a binary file.
+
+    Returns the number of rows with more columns than the header.
+    """
+    students = student_count(rows)
+    prefixes, malformed = _student_prefixes(students, seed)
+    skills = [
+        f"{chr(65 + k // 10)}.{k % 10 + 1} Skill {k + 1}" for k in range(SKILLS_PER_STUDENT)
+    ]
+    # SmartScore text by value, with the blank for missing scores last
+    scores = [str(score) for score in range(101)] + [""]
+    # Rows per student, the last of whom may not have every skill
+    student_rows = np.full(students, SKILLS_PER_STUDENT)
+    student_rows[-1] = rows - (students - 1) * SKILLS_PER_STUDENT
+    malformed_rows = int(student_rows[malformed].sum())
+
+    rng = np.random.default_rng([seed, 3])
+    output.write(EXPORT_HEADER.encode("utf-8"))
+    for start in range(0, rows, WRITE_CHUNK_ROWS):
+        end = min(start + WRITE_CHUNK_ROWS, rows)
+        row_numbers = np.arange(start, end)
+        smart_scores = rng.integers(0, 101, size=end - start)
+        smart_scores[rng.random(end - start) < MISSING_SCORE_RATE] = 101
+        lines = [
+            f"{prefixes[row // SKILLS_PER_STUDENT]}{skills[row % SKILLS_PER_STUDENT]},"
+            f"{scores[score]}\n"
+            for row, score in zip(row_numbers.tolist(), smart_scores.tolist())
+        ]
+        output.write("".join(lines).encode("utf-8"))
+    return malformed_rows
+
+
+def write_overrides(output: BinaryIO, rows: int, seed: int = 0) -> int:
+    """Write student overrides matching the export of the given size and seed.
+
+    About OVERRIDE_RATE of the export's students get an override, with their IDs
+    written with or without the "ID" prefix independently of the export. Returns the
+    number of overrides written.
+    """
+    students = student_count(rows)
+    rng = np.random.default_rng([seed, 4])
+    chosen = np.flatnonzero(rng.random(students) < OVERRIDE_RATE)
+    prefixed = rng.random(len(chosen)) < PREFIXED_ID_RATE
+    thresholds = rng.integers(50, 91, size=len(chosen))
+    minimum_grades = rng.integers(40, 71, size=len(chosen))
+    blank_thresholds = rng.random(len(chosen)) < OVERRIDE_BLANK_RATE
+    # Keep at least one value per override
+    blank_minimums = (rng.random(len(chosen)) < OVERRIDE_BLANK_RATE) & ~blank_thresholds
+
+    lines = [OVERRIDES_HEADER]
+    for student, prefix, threshold, minimum, no_threshold, no_minimum in zip(
+        chosen.tolist(),
+        prefixed.tolist(),
+        thresholds.tolist(),
+        minimum_grades.tolist(),
+        blank_thresholds.tolist(),
+        blank_minimums.tolist(),
+    ):
+        student_id = f"ID{1000000 + student}" if prefix else str(1000000 + student)
+        lines.append(
+            f"{student_id},{'' if no_threshold else threshold},"
+            f"{'' if no_minimum else minimum}\n"
+        )
+    output.write("".join(lines).encode("utf-8"))
+    return len(chosen)
+
+
+def make_export(rows: int, seed: int = 0) -> bytes:
+    """Build a synthetic IXL export in memory."""
+    buffer = io.BytesIO()
+    write_export(buffer, rows, seed)
+    return buffer.getvalue()
+
+
+def make_overrides(rows: int, seed: int = 0) -> bytes:
+    """Build student overrides in memory matching make_export(rows, seed)."""
+    buffer = io.BytesIO()
+    write_overrides(buffer, rows, seed)
+    return buffer.getvalue()
+
+
+def main() -> None:
+    if len(sys.argv) < 2:
+        sys.exit(__doc__)
+    output_dir = Path(sys.argv[1])
+    output_dir.mkdir(parents=True, exist_ok=True)
+    sizes = sys.argv[2:] or list(SIZES)
+
+    print(f"{'size':>8} {'rows':>12} {'malformed':>10} {'overrides':>10}  files")
+    for size in sizes:
+        rows = resolve_size(size)
+        export_path = output_dir / f"ixl_export_{size}.csv"
+        overrides_path = output_dir / f"student_overrides_{size}.csv"
+        with open(export_path, "wb") as file:
+            malformed_rows = write_export(file, rows)
+        with open(overrides_path, "wb") as file:
+            overrides = write_overrides(file, rows)
+        print(
+            f"{size:>8} {rows:>12,} {malformed_rows:>10,} {overrides:>10,}  "
+            f"{export_path.name}, {overrides_path.name}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""Grade many IXL exports from the command line without the Streamlit UI."""
+
+import argparse
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from ixl_grader.core.parsing import PARSER_ENGINES, set_parser_engine
+from ixl_grader.core.report import DEFAULT_CHUNK_ROWS, Report
+from ixl_grader.core.student_overrides import StudentOverrides
+
+
+GRADED_SUFFIX = "-Graded"
+
+
+class GradeResult(NamedTuple):
+    input_path: str
+    output_path: str
+    rows: int
+    seconds: float
+
+
+# Overrides shared by every report graded in a worker process
+_worker_overrides: Optional[StudentOverrides] = None
+
+
+def _init_worker(
+    overrides_path: Optional[str], use_saved_overrides: bool, parser_engine: str
+) -> None:
+    global _worker_overrides
+
+    set_parser_engine(parser_engine)
+
+    if overrides_path is not None:
+        # Batch overrides stay in memory so they never replace the saved ones
+        _worker_overrides = StudentOverrides(persist=False)
+        _worker_overrides.import_overrides(overrides_path)
+    else:
+        _worker_overrides = StudentOverrides(persist=use_saved_overrides)
+
+
+def grade_file(
+    input_path: str,
+    output_path: str,
+    smart_score_threshold: int,
+    chunk_rows: Optional[int] = None,
+) -> GradeResult:
+    """Import, grade and export a single IXL export.
+
+    With chunk_rows set, the export is streamed through in chunks of that many rows.
+    """
+    start = time.perf_counter()
+
+    if chunk_rows is not None:
+        report = Report(student_overrides=_worker_overrides)
+        rows = report.grade_stream(
+            input_path, output_path, smart_score_threshold, chunk_rows=chunk_rows
+        )
+        return GradeResult(
+            input_path=input_path,
+            output_path=output_path,
+            rows=rows,
+            seconds=time.perf_counter() - start,
+        )
+
+    report = Report(student_overrides=_worker_overrides)
+    report.import_report(input_path)
+    report.grade(smart_score_threshold=smart_score_threshold)
+    report.export_report(output_path)
+
+    return GradeResult(
+        input_path=input_path,
+        output_path=output_path,
+        rows=report.get_score_summary()["Total Students"],
+        seconds=time.perf_counter() - start,
+    )
+
+
+def find_reports(patterns: list[str]) -> list[str]:
+    """Expand directories and glob patterns into IXL export paths.
+
+    Previously graded outputs are skipped so reruns don't grade their own results.
+    """
+    paths: list[str] = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = glob.glob(os.path.join(pattern, "*.csv"))
+        else:
+            matches = glob.glob(pattern)
+        paths.extend(
+            path for path in sorted(matches) if not Path(path).stem.endswith(GRADED_SUFFIX)
+        )
+
+    # Drop duplicates from overlapping patterns, keeping the first occurrence
+    return list(dict.fromkeys(paths))
+
+
+def get_output_path(input_path: str, output_dir: Optional[str]) -> str:
+    path = Path(input_path)
+    directory = Path(output_dir) if output_dir is not None else path.parent
+    return str(directory / f"{path.stem}{GRADED_SUFFIX}{path.suffix}")
+
+
+def _parse_args(argv: Optional[list[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="ixl-grader-batch",
+        description="Grade directories or globs of IXL assignment CSV exports.",
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="+",
+        help="IXL export CSV files, directories of them, or glob patterns",
+    )
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=int,
+        default=80,
+        help="SmartScore threshold for full credit (1-100, default: 80)",
+    )
+    overrides_group = parser.add_mutually_exclusive_group()
+    overrides_group.add_argument(
+        "--overrides",
+        help="Student overrides CSV to use instead of the saved overrides",
+    )
+    overrides_group.add_argument(
+        "--no-overrides",
+        action="store_true",
+        help="Ignore saved student overrides",
+    )
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        help="Directory for graded CSVs (default: next to each input)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Grade each export in fixed-size chunks to bound memory on very large files",
+    )
+    parser.add_argument(
+        "--chunk-rows",
+        type=int,
+        default=DEFAULT_CHUNK_ROWS,
+        help=f"Rows per chunk with --stream (default: {DEFAULT_CHUNK_ROWS})",
+    )
+    parser.add_argument(
+        "--parser-engine",
+        choices=PARSER_ENGINES,
+        default="auto",
+        help="CSV parser engine; auto uses pyarrow when installed (default: auto)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+
+    args = parser.parse_args(argv)
+    if not 1 <= args.threshold <= 100:
+        parser.error("--threshold must be between 1 and 100")
+    if args.chunk_rows < 1:
+        parser.error("--chunk-rows must be at least 1")
+    return args
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = _parse_args(argv)
+
+    input_paths = find_reports(args.inputs)
+    if not input_paths:
+        print("No IXL export CSVs found.", file=sys.stderr)
+        return 1
+
+    if args.output_dir is not None:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    failures = 0
+    total_rows = 0
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(
+        max_workers=args.jobs,
+        initializer=_init_worker,
+        initargs=(args.overrides, not args.no_overrides, args.parser_engine),
+    ) as executor:
+        futures = {
+            executor.submit(
+                grade_file,
+                input_path,
+                get_output_path(input_path, args.output_dir),
+                args.threshold,
+                args.chunk_rows if args.stream else None,
+            ): input_path
+            for input_path in input_paths
+        }
+
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                failures += 1
+                print(f"FAILED  {futures[future]}: {e!r}", file=sys.stderr)
+                continue
+
+            total_rows += result.rows
+            print(
+                f"graded  {result.input_path} -> {result.output_path} "
+                f"({result.rows} rows in {result.seconds:.3f}s)"
+            )
+
+    elapsed = time.perf_counter() - start
+    graded_files = len(input_paths) - failures
+    print(
+        f"\n{graded_files}/{len(input_paths)} files, {total_rows} rows in {elapsed:.2f}s "
+        f"({graded_files / elapsed:.1f} files/s, {total_rows / elapsed:.0f} rows/s)"
+    )
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
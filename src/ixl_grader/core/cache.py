@@ -0,0 +1,75 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+# Default memory cap for cached reports
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class ReportCache:
+    """
+    A thread-safe LRU cache for parsed and graded reports.
+    Entries are evicted least recently used first once their total size exceeds max_bytes.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initialize an empty cache holding at most max_bytes of entries."""
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value and mark it recently used, or None if not cached."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, nbytes: int) -> None:
+        """Cache a value of the given size, evicting older entries to stay under the cap."""
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous[1]
+
+            # Values larger than the whole cache are never kept
+            if nbytes > self._max_bytes:
+                return
+
+            self._entries[key] = (value, nbytes)
+            self._size += nbytes
+            while self._size > self._max_bytes:
+                _, (_, evicted_nbytes) = self._entries.popitem(last=False)
+                self._size -= evicted_nbytes
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def get_size(self) -> int:
+        """Get the total size in bytes of all cached entries."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def content_hash(data: bytes) -> str:
+    """Hash raw upload bytes into a cache key."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+# Global instance for the application
+_report_cache = ReportCache()
+
+
+def get_report_cache() -> ReportCache:
+    """Get the global report cache instance."""
+    return _report_cache
@@ -0,0 +1,217 @@
+import threading
+import time
+import tracemalloc
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+
+class StageStats(NamedTuple):
+    """Measurements from one run of a stage, such as parsing a report or grading it."""
+
+    # What recorded the stage: "report" or "student_overrides"
+    source: str
+    stage: str
+    seconds: float
+    rows: int
+    rows_repaired: int
+    # Peak bytes allocated above the start of the stage, or None without memory tracking
+    peak_bytes: Optional[int]
+
+
+# Called with every stage recorded while diagnostics are enabled
+StatsHook = Callable[[StageStats], None]
+
+_enabled = False
+_track_memory = False
+# Whether tracemalloc was started here, and so should be stopped here
+_started_tracemalloc = False
+_hooks: Dict[int, StatsHook] = {}
+_next_hook_id = 0
+_settings_lock = threading.Lock()
+# The stages open on each thread, innermost last
+_open_stages = threading.local()
+
+
+def is_enabled() -> bool:
+    """Check whether stages are being recorded."""
+    return _enabled
+
+
+def is_tracking_memory() -> bool:
+    """Check whether recorded stages include their peak memory allocation."""
+    return _enabled and _track_memory
+
+
+def set_enabled(enabled: bool, track_memory: bool = False) -> None:
+    """Turn stage recording on or off for the whole process.
+
+    While disabled, opening a stage costs a single flag check. Memory tracking uses
+    tracemalloc, which slows down everything allocated while it runs, so it is only
+    worth turning on while investigating. It sees NumPy and pandas allocations but
+    not pyarrow's, and stages running on other threads at the same time add to each
+    other's peaks.
+    """
+    global _enabled, _track_memory, _started_tracemalloc
+    with _settings_lock:
+        track_memory = enabled and track_memory
+        if track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _started_tracemalloc = True
+        elif not track_memory and _started_tracemalloc:
+            tracemalloc.stop()
+            _started_tracemalloc = False
+        _track_memory = track_memory
+        _enabled = enabled
+
+
+def add_stats_hook(hook: StatsHook) -> Callable[[], None]:
+    """Call hook with each recorded stage; returns a function that removes it.
+
+    Hooks run on the thread that ran the stage, once it has finished. StageStats is a
+    named tuple, so stats._asdict() gives a record ready for structured logging.
+    """
+    global _next_hook_id
+    with _settings_lock:
+        hook_id = _next_hook_id
+        _next_hook_id += 1
+        _hooks[hook_id] = hook
+
+    def remove() -> None:
+        with _settings_lock:
+            _hooks.pop(hook_id, None)
+
+    return remove
+
+
+class StageRecorder:
+    """
+    Keeps the most recent stats of each stage run by one report or overrides manager.
+    Stages are timed with `with recorder.stage(name) as stage:`, which does nothing
+    while diagnostics are disabled.
+    """
+
+    def __init__(self, source: str):
+        """Create a recorder whose stages are labeled with source."""
+        self._source = source
+        self._stats: Dict[str, StageStats] = {}
+        self._lock = threading.Lock()
+
+    def stage(self, name: str) -> "_Stage | _NullStage":
+        """Open a stage to be timed and recorded when its with block exits."""
+        if not _enabled:
+            return _NULL_STAGE
+        return _Stage(self, name)
+
+    def stats(self) -> Dict[str, StageStats]:
+        """Get the most recent stats of each stage, in the order they first finished."""
+        with self._lock:
+            return dict(self._stats)
+
+    def clear(self) -> None:
+        """Forget all recorded stages."""
+        with self._lock:
+            self._stats.clear()
+
+    def _record(self, stats: StageStats) -> None:
+        with self._lock:
+            self._stats[stats.stage] = stats
+        for hook in list(_hooks.values()):
+            hook(stats)
+
+
+class _Stage:
+    __slots__ = (
+        "_recorder",
+        "_name",
+        "_rows",
+        "_rows_repaired",
+        "_discarded",
+        "_start",
+        "_memory_start",
+        "_peak",
+    )
+
+    def __init__(self, recorder: StageRecorder, name: str):
+        self._recorder = recorder
+        self._name = name
+        self._rows = 0
+        self._rows_repaired = 0
+        self._discarded = False
+        self._memory_start: Optional[int] = None
+        self._peak = 0
+
+    def set_rows(self, rows: int, rows_repaired: int = 0) -> None:
+        """Set the number of rows the stage processed and repaired."""
+        self._rows = rows
+        self._rows_repaired = rows_repaired
+
+    def discard(self) -> None:
+        """Leave the stage unrecorded, keeping the previous stats of the stage."""
+        self._discarded = True
+
+    def __enter__(self) -> "_Stage":
+        stack = _stage_stack()
+        if _track_memory and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            # Resetting the peak below would lose the enclosing stage's peak so far
+            if stack:
+                stack[-1]._peak = max(stack[-1]._peak, peak)
+            tracemalloc.reset_peak()
+            self._memory_start = current
+            self._peak = current
+        stack.append(self)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        seconds = time.perf_counter() - self._start
+        stack = _stage_stack()
+        stack.pop()
+
+        peak_bytes = None
+        if self._memory_start is not None and tracemalloc.is_tracing():
+            _, peak = tracemalloc.get_traced_memory()
+            peak = max(peak, self._peak)
+            if stack:
+                stack[-1]._peak = max(stack[-1]._peak, peak)
+            peak_bytes = peak - self._memory_start
+
+        # Stages that raised are not recorded, so stats only describe finished work
+        if exc_type is None and not self._discarded:
+            self._recorder._record(
+                StageStats(
+                    self._recorder._source,
+                    self._name,
+                    seconds,
+                    self._rows,
+                    self._rows_repaired,
+                    peak_bytes,
+                )
+            )
+
+
+class _NullStage:
+    """Stands in for a stage while diagnostics are disabled."""
+
+    __slots__ = ()
+
+    def set_rows(self, rows: int, rows_repaired: int = 0) -> None:
+        pass
+
+    def discard(self) -> None:
+        pass
+
+    def __enter__(self) -> "_NullStage":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+def _stage_stack() -> List[_Stage]:
+    stack = getattr(_open_stages, "stack", None)
+    if stack is None:
+        stack = _open_stages.stack = []
+    return stack
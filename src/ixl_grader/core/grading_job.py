@@ -0,0 +1,128 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from .report import Report
+
+# Background grading threads shared by every report in the process
+GRADING_WORKERS = 2
+
+
+class GradingJob:
+    """
+    A report grade running in the background, graded in chunks of rows.
+    Progress and the scores of rows graded so far can be read while it runs, and
+    cancelling stops it at the next chunk, leaving the report's grades as they were.
+    """
+
+    def __init__(self, report: "Report", smart_score_threshold: int, chunk_rows: int):
+        """Create a job grading report at smart_score_threshold, chunk_rows rows at a time."""
+        self.smart_score_threshold = smart_score_threshold
+        self.chunk_rows = chunk_rows
+        self._report = report
+        self._cancel_requested = threading.Event()
+        self._finished = threading.Event()
+        self._rows_total = 0
+        self._rows_graded = 0
+        # Scores in report row order, filled as chunks finish
+        self._scores: Optional[np.ndarray] = None
+        # Set once the grades are on the report, after which cancelling has no effect
+        self._applied = False
+        self._error: Optional[BaseException] = None
+
+    def run(self) -> None:
+        """Grade the report on the calling thread; the executor runs this."""
+        try:
+            if not self._cancel_requested.is_set():
+                self._report._run_grading_job(self)
+        except Exception as e:
+            self._error = e
+        finally:
+            self._finished.set()
+
+    def cancel(self) -> None:
+        """Stop grading before the next chunk. Rows already graded are discarded.
+
+        A job whose grades were already applied to the report is left as it is.
+        """
+        self._cancel_requested.set()
+
+    def is_cancelled(self) -> bool:
+        """Check whether the job was cancelled before its grades were applied."""
+        return self._cancel_requested.is_set() and not self._applied
+
+    def is_done(self) -> bool:
+        """Check whether the job has finished, been cancelled or failed."""
+        return self._finished.is_set()
+
+    def succeeded(self) -> bool:
+        """Check whether the job finished and its grades were applied to the report."""
+        return self.is_done() and self._applied
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the job to finish; returns False if timeout seconds passed first."""
+        return self._finished.wait(timeout)
+
+    def get_error(self) -> Optional[BaseException]:
+        """Get the exception grading raised, or None."""
+        return self._error
+
+    def get_progress(self) -> float:
+        """Get the fraction of rows graded so far, from 0 to 1."""
+        if self.succeeded():
+            return 1.0
+        if self._rows_total == 0:
+            return 0.0
+        return self._rows_graded / self._rows_total
+
+    def get_rows_graded(self) -> int:
+        """Get the number of rows graded so far."""
+        return self._rows_graded
+
+    def get_rows_total(self) -> int:
+        """Get the number of rows to grade, or 0 before grading starts."""
+        return self._rows_total
+
+    def get_partial_results(self, n: Optional[int] = None) -> pd.DataFrame:
+        """Get the export columns of the rows graded so far, or of the first n of them."""
+        rows = self._rows_graded
+        if n is not None:
+            rows = min(rows, n)
+        if self._scores is None:
+            # Grades were applied in one step, so the report already has every score
+            return self._report.head(rows, columns=self._report._export_columns())
+        return self._report._partial_results(self._scores[:rows])
+
+    def _start(self, rows_total: int) -> np.ndarray:
+        self._rows_total = rows_total
+        self._rows_graded = 0
+        self._scores = np.full(rows_total, np.nan)
+        return self._scores
+
+    def _advance(self, rows_graded: int) -> None:
+        self._rows_graded = rows_graded
+
+    def _finish(self, rows_total: int) -> None:
+        self._rows_total = rows_total
+        self._rows_graded = rows_total
+        self._applied = True
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_grading_executor() -> ThreadPoolExecutor:
+    """Get the thread pool that runs background grading jobs."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=GRADING_WORKERS, thread_name_prefix="ixl-grading"
+                )
+    return _executor
@@ -0,0 +1,246 @@
+import threading
+import weakref
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+
+import pandas as pd
+
+from .persistence import LocalStorage, get_local_storage
+
+OVERRIDE_COLUMNS = ["Student ID", "Smart Score Threshold", "Minimum Grade"]
+
+# Called with the new store version and the Student IDs that changed, or None if any may have
+ChangeListener = Callable[[int, Optional[Set[str]]], None]
+
+
+class SharedOverrideStore:
+    """
+    Process-wide student overrides shared by every session of the app.
+    The overrides are loaded from local storage and handed out as read-only
+    snapshots. Writes are serialized, saved to local storage and published as a new
+    snapshot, so readers never see a half-applied change and never need a copy.
+    Overrides saved to local storage by another process are reloaded and published
+    the next time the store is used.
+    """
+
+    def __init__(self, local_storage: Optional[LocalStorage] = None):
+        """Create a store over local_storage, or the global local storage if None."""
+        self._local_storage = local_storage
+        self._loaded = False
+        # The local storage signature when the overrides were last read or saved
+        self._signature: Optional[Tuple[int, ...]] = None
+        # Serializes loading and writing, and keeps snapshots consistent
+        self._lock = threading.Lock()
+        self._version = 0
+        self._overrides: Optional[pd.DataFrame] = None
+        # Maps a cleaned Student ID to the label of its row in _overrides
+        self._index: Dict[str, int] = {}
+        self._listeners: Dict[int, Callable[[], Optional[ChangeListener]]] = {}
+        self._next_listener_id = 0
+
+    def snapshot(self) -> Tuple[int, Optional[pd.DataFrame], Dict[str, int]]:
+        """Get the current version, overrides and Student ID index.
+
+        The frame and index are shared with every other reader and must not be
+        modified; copy them before making changes.
+        """
+        self._ensure_loaded()
+        # Writers swap all three together, so read them under the same lock
+        with self._lock:
+            return self._version, self._overrides, self._index
+
+    def refresh(self) -> int:
+        """Reload the overrides if another process saved them; returns the version."""
+        self._ensure_loaded()
+        return self._version
+
+    def get_version(self) -> int:
+        """Get a counter that changes whenever the shared overrides do."""
+        return self._version
+
+    def update(
+        self, upserts: Optional[pd.DataFrame], deleted_ids: Iterable[str] = ()
+    ) -> int:
+        """Replace some students' overrides with the given rows and remove others.
+
+        Returns the new version.
+        """
+        self._ensure_loaded()
+        deleted_ids = set(deleted_ids)
+        with self._lock:
+            overrides = self._overrides
+            index = dict(self._index)
+
+            if upserts is not None and len(upserts) == 0:
+                upserts = None
+            if upserts is not None:
+                upserts = upserts[OVERRIDE_COLUMNS]
+                deleted_ids.difference_update(upserts["Student ID"])
+                overrides, index = _upsert(overrides, index, upserts)
+
+            removed_labels = [index.pop(i) for i in deleted_ids if i in index]
+            if removed_labels:
+                overrides = overrides.drop(index=removed_labels)
+
+            self._local_storage.update_student_overrides(upserts, deleted_ids)
+            self._signature = self._local_storage.overrides_signature()
+            changed_ids = deleted_ids.union(
+                upserts["Student ID"] if upserts is not None else ()
+            )
+            version = self._publish(overrides, index)
+            self._notify(version, changed_ids)
+        return version
+
+    def replace(self, overrides: Optional[pd.DataFrame]) -> int:
+        """Replace all overrides, or clear them when overrides is None or empty.
+
+        Returns the new version.
+        """
+        self._ensure_loaded()
+        with self._lock:
+            if overrides is not None and len(overrides) > 0:
+                overrides = _deduplicate(overrides[OVERRIDE_COLUMNS].copy())
+                self._local_storage.save_student_overrides(overrides)
+            else:
+                overrides = None
+                self._local_storage.clear_student_overrides()
+            self._signature = self._local_storage.overrides_signature()
+            version = self._publish(overrides, _build_index(overrides))
+            self._notify(version, None)
+        return version
+
+    def subscribe(self, listener: ChangeListener) -> Callable[[], None]:
+        """Call listener after every change; returns a function that unsubscribes.
+
+        Listeners are called in version order while writes are held off, so they must
+        be quick and must not call back into the store. Bound methods are held weakly,
+        so subscribing does not keep their object alive.
+        """
+        if hasattr(listener, "__self__"):
+            reference = weakref.WeakMethod(listener)
+        else:
+            reference = lambda: listener  # noqa: E731
+
+        with self._lock:
+            listener_id = self._next_listener_id
+            self._next_listener_id += 1
+            self._listeners[listener_id] = reference
+
+        def unsubscribe() -> None:
+            with self._lock:
+                self._listeners.pop(listener_id, None)
+
+        return unsubscribe
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            # A cheap check of the storage file, so snapshots keep up with other processes
+            if self._local_storage.overrides_signature() != self._signature:
+                self._reload()
+            return
+
+        with self._lock:
+            if self._loaded:
+                return
+            if self._local_storage is None:
+                self._local_storage = get_local_storage()
+            overrides = self._read_storage()
+            _build_label_lookup(overrides)
+            self._overrides = overrides
+            self._index = _build_index(overrides)
+            self._loaded = True
+
+    def _reload(self) -> None:
+        with self._lock:
+            if self._local_storage.overrides_signature() == self._signature:
+                # Another thread reloaded first
+                return
+            overrides = self._read_storage()
+            version = self._publish(overrides, _build_index(overrides))
+            self._notify(version, None)
+
+    def _read_storage(self) -> Optional[pd.DataFrame]:
+        # Taken before reading, so a save made during the read is reloaded next time
+        self._signature = self._local_storage.overrides_signature()
+        overrides = self._local_storage.load_student_overrides()
+        if overrides is not None and len(overrides) > 0:
+            return _deduplicate(overrides)
+        return None
+
+    def _publish(self, overrides: Optional[pd.DataFrame], index: Dict[str, int]) -> int:
+        if overrides is not None and len(overrides) == 0:
+            overrides = None
+        _build_label_lookup(overrides)
+        self._overrides = overrides
+        self._index = index
+        self._version += 1
+        return self._version
+
+    def _notify(self, version: int, changed_ids: Optional[Set[str]]) -> None:
+        # Called with the lock held, so no listener sees a later change before this one
+        for listener_id, reference in list(self._listeners.items()):
+            listener = reference()
+            if listener is None:
+                del self._listeners[listener_id]
+                continue
+            listener(version, changed_ids)
+
+
+def _deduplicate(overrides: pd.DataFrame) -> pd.DataFrame:
+    # Only the first override for a student was ever used for lookups
+    if overrides["Student ID"].duplicated().any():
+        overrides = overrides.drop_duplicates(subset=["Student ID"], keep="first")
+    return overrides
+
+
+def _build_index(overrides: Optional[pd.DataFrame]) -> Dict[str, int]:
+    if overrides is None:
+        return {}
+    return dict(zip(overrides["Student ID"], overrides.index))
+
+
+def _build_label_lookup(overrides: Optional[pd.DataFrame]) -> None:
+    # pandas builds an index's label hash table on first lookup, and copies of the frame
+    # share it. Building it on several threads at once can miss labels, so snapshots
+    # are published with it already built.
+    if overrides is not None:
+        overrides.index.is_unique
+
+
+def _upsert(
+    overrides: Optional[pd.DataFrame], index: Dict[str, int], upserts: pd.DataFrame
+) -> Tuple[pd.DataFrame, Dict[str, int]]:
+    """Apply whole override rows to a copy of overrides, keeping existing row order."""
+    labels = upserts["Student ID"].map(index)
+    existing = labels.notna().to_numpy()
+
+    if existing.any():
+        # The published frame is shared, so changes go to a copy
+        overrides = overrides.copy()
+        update_labels = labels[existing].astype(int).to_numpy()
+        for column in OVERRIDE_COLUMNS[1:]:
+            overrides.loc[update_labels, column] = upserts[column].to_numpy()[existing]
+
+    additions = upserts[~existing]
+    if len(additions) > 0:
+        has_rows = overrides is not None and len(overrides) > 0
+        start = int(overrides.index.max()) + 1 if has_rows else 0
+        additions = additions.set_axis(pd.RangeIndex(start, start + len(additions)))
+        overrides = pd.concat([overrides, additions]) if has_rows else additions
+        index.update(zip(additions["Student ID"], additions.index))
+
+    return overrides, index
+
+
+# Global instance for the application, created on first use
+_shared_override_store: Optional[SharedOverrideStore] = None
+_shared_override_store_lock = threading.Lock()
+
+
+def get_shared_override_store() -> SharedOverrideStore:
+    """Get the process-wide shared override store."""
+    global _shared_override_store
+    if _shared_override_store is None:
+        with _shared_override_store_lock:
+            if _shared_override_store is None:
+                _shared_override_store = SharedOverrideStore()
+    return _shared_override_store
@@ -0,0 +1,134 @@
+from typing import Callable, Hashable, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from .cache import ReportCache
+
+
+# Rows shown per page of a preview
+DEFAULT_PAGE_SIZE = 50
+
+# Memory cap for the row orders and page slices each report or override set keeps
+PAGE_CACHE_BYTES = 16 * 1024 * 1024
+
+
+class PagedRows:
+    """
+    Pages through a frame in a searched and sorted order, one slice at a time.
+    Row orders and page slices are cached per version of the frame, so paging back
+    and forth or redrawing the same page does not search, sort or slice again.
+    """
+
+    def __init__(self, max_bytes: int = PAGE_CACHE_BYTES):
+        """Initialize with an empty cache holding at most max_bytes of orders and pages."""
+        self._cache = ReportCache(max_bytes)
+
+    def get_page(
+        self,
+        frame: pd.DataFrame,
+        version: Hashable,
+        page: int,
+        page_size: int,
+        columns: Optional[Iterable[str]],
+        sort_by: Optional[str],
+        ascending: bool,
+        search: Optional[str],
+        search_columns: Iterable[str],
+        find_id: Callable[[str], Optional[np.ndarray]],
+    ) -> tuple[pd.DataFrame, int]:
+        """Get one page of frame and the number of rows matching the search.
+
+        version must change whenever frame does. find_id maps the search text to the
+        positions of rows with exactly that Student ID, or None to fall back to a
+        case-insensitive substring match on search_columns. page is zero-based and
+        clamped to the last page.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        search = (search or "").strip()
+        columns = tuple(frame.columns if columns is None else columns)
+
+        order_key = ("order", version, sort_by, ascending, search)
+        positions = self._cache.get(order_key)
+        if positions is None:
+            positions = _sort_rows(
+                frame,
+                _find_rows(frame, search, search_columns, find_id),
+                sort_by,
+                ascending,
+            )
+            self._cache.put(order_key, positions, positions.nbytes)
+
+        page = min(max(page, 0), max(page_count(len(positions), page_size) - 1, 0))
+        page_key = order_key + (columns, page, page_size)
+        rows = self._cache.get(page_key)
+        if rows is None:
+            start = page * page_size
+            rows = frame.iloc[
+                positions[start : start + page_size], frame.columns.get_indexer(columns)
+            ].reset_index(drop=True)
+            # A slice keeps every category of its column, which would all be sent along
+            for column in rows.columns:
+                if isinstance(rows[column].dtype, pd.CategoricalDtype):
+                    rows[column] = rows[column].cat.remove_unused_categories()
+            self._cache.put(page_key, rows, int(rows.memory_usage(deep=True).sum()))
+
+        # Cached slices are shared between reruns, so hand out a copy of the few rows
+        return rows.copy(), len(positions)
+
+    def clear(self) -> None:
+        """Drop all cached row orders and pages."""
+        self._cache.clear()
+
+
+def page_count(rows: int, page_size: int = DEFAULT_PAGE_SIZE) -> int:
+    """Get the number of pages needed to show rows, at least one."""
+    return max(-(-rows // page_size), 1)
+
+
+def _find_rows(
+    frame: pd.DataFrame,
+    search: str,
+    search_columns: Iterable[str],
+    find_id: Callable[[str], Optional[np.ndarray]],
+) -> np.ndarray:
+    if not search:
+        return np.arange(len(frame))
+
+    positions = find_id(search)
+    if positions is not None:
+        return np.sort(positions)
+
+    matches = np.zeros(len(frame), dtype=bool)
+    for column in search_columns:
+        if column in frame.columns:
+            matches |= _contains(frame[column], search)
+    return np.flatnonzero(matches)
+
+
+def _contains(column: pd.Series, text: str) -> np.ndarray:
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        # Match each distinct label once, then spread the result over the rows by code
+        categories = column.cat.categories.astype(str)
+        matched = categories.str.contains(text, case=False, regex=False)
+        # Missing values have code -1, which picks the trailing False
+        return np.append(matched, False)[column.cat.codes.to_numpy()]
+    matched = column.astype("string").str.contains(text, case=False, regex=False)
+    return matched.fillna(False).to_numpy(dtype=bool)
+
+
+def _sort_rows(
+    frame: pd.DataFrame, positions: np.ndarray, sort_by: Optional[str], ascending: bool
+) -> np.ndarray:
+    if sort_by is None or len(positions) == 0:
+        return positions
+    values = frame[sort_by].iloc[positions].reset_index(drop=True)
+    if (
+        isinstance(values.dtype, pd.CategoricalDtype)
+        and not values.cat.categories.is_monotonic_increasing
+    ):
+        # Categoricals sort by category order, so only sort labels when it isn't theirs
+        values = values.astype(str).where(values.notna())
+    order = values.sort_values(ascending=ascending, kind="stable", na_position="last")
+    return positions[order.index.to_numpy()]
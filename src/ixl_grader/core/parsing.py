@@ -0,0 +1,110 @@
+import importlib.util
+import io
+from os import PathLike
+from typing import BinaryIO, Iterable, TextIO
+
+import numpy as np
+import pandas as pd
+
+
+# "auto" uses the Arrow CSV reader when pyarrow is installed and pandas' C parser otherwise
+PARSER_ENGINES = ("auto", "c", "pyarrow")
+
+# Checked without importing pyarrow, which is slow to load and only needed to parse
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+_parser_engine = "auto"
+
+
+def get_parser_engine() -> str:
+    """Get the default CSV parser engine setting."""
+    return _parser_engine
+
+
+def set_parser_engine(engine: str) -> None:
+    """Set the default CSV parser engine used for reports and overrides."""
+    global _parser_engine
+    _check_parser_engine(engine)
+    _parser_engine = engine
+
+
+def resolve_parser_engine(engine: str | None = None) -> str:
+    """Resolve an engine setting (or the default, if None) to the engine actually used."""
+    engine = engine if engine is not None else _parser_engine
+    _check_parser_engine(engine)
+
+    if engine == "auto":
+        return "pyarrow" if HAS_PYARROW else "c"
+    if engine == "pyarrow" and not HAS_PYARROW:
+        raise ValueError("The pyarrow parser engine requires pyarrow to be installed.")
+    return engine
+
+
+def read_csv(
+    source: str | PathLike | BinaryIO | TextIO,
+    engine: str | None = None,
+    text_columns: Iterable[str] = (),
+) -> pd.DataFrame:
+    """Read a CSV with the configured parser engine.
+
+    Both engines produce the same frame: the Arrow reader parses on multiple threads,
+    and its missing text values are converted to NaN like pandas' C parser. Files the
+    Arrow reader rejects, such as rows with too few columns, are re-read with the C
+    parser, which pads them with NaN.
+
+    text_columns are read as text exactly as written, so IDs keep their leading zeros
+    even when every value looks like a number. Columns missing from the file are
+    ignored.
+    """
+    engine = resolve_parser_engine(engine)
+    dtype = {column: str for column in text_columns} or None
+    # The Arrow reader only takes binary files
+    if engine == "c" or isinstance(source, io.TextIOBase):
+        return pd.read_csv(source, dtype=dtype)
+
+    start = source.tell() if hasattr(source, "seek") else None
+    try:
+        if dtype is None:
+            df = pd.read_csv(source, engine="pyarrow")
+        else:
+            df = _read_arrow_csv(source, list(dtype))
+    except pd.errors.ParserError:
+        if start is not None:
+            source.seek(start)
+        return pd.read_csv(source, dtype=dtype)
+
+    object_columns = df.select_dtypes(include="object").columns
+    df[object_columns] = df[object_columns].where(df[object_columns].notna(), np.nan)
+    return df
+
+
+def _read_arrow_csv(
+    source: str | PathLike | BinaryIO, text_columns: list[str]
+) -> pd.DataFrame:
+    # pandas' pyarrow engine applies dtype only after Arrow has inferred each column,
+    # which turns "00123" into 123, so text columns are declared to Arrow directly
+    import pyarrow as pa
+    from pyarrow import csv
+
+    convert_options = csv.ConvertOptions(
+        column_types={column: pa.string() for column in text_columns},
+        strings_can_be_null=True,
+    )
+    try:
+        table = csv.read_csv(source, convert_options=convert_options)
+    except pa.ArrowInvalid as e:
+        raise pd.errors.ParserError(e) from e
+
+    # Columns with nothing but blanks are read as floats, as pandas does
+    schema = pa.schema(
+        field.with_type(pa.float64()) if pa.types.is_null(field.type) else field
+        for field in table.schema
+    )
+    return table.cast(schema).to_pandas()
+
+
+def _check_parser_engine(engine: str) -> None:
+    if engine not in PARSER_ENGINES:
+        raise ValueError(
+            f"Unknown parser engine {engine!r}; expected one of {PARSER_ENGINES}"
+        )
@@ -1,8 +1,17 @@
+from __future__ import annotations
+
 import json
 import os
+import sqlite3
+import tempfile
+import threading
+from contextlib import closing
 from pathlib import Path
-from typing import Optional, Dict, Any
-import pandas as pd
+from typing import TYPE_CHECKING, Optional, Dict, Any, Callable, Iterable, Tuple
+
+if TYPE_CHECKING:
+    # pandas is slow to import and only needed once overrides are read or written
+    import pandas as pd
 
 
 class LocalStorage:
@@ -24,15 +33,33 @@ class LocalStorage:
         # File paths for different data types
         self.overrides_file = self.storage_dir / "student_overrides.json"
         self.settings_file = self.storage_dir / "settings.json"
+        
+        # The last overrides read, keyed by the overrides_signature they were read at
+        self._overrides_cache: Optional[Tuple[Tuple[int, ...], Optional[pd.DataFrame]]] = None
+    
+    def _load_cached(self,
+                     load: Callable[[], Optional[pd.DataFrame]]) -> Optional[pd.DataFrame]:
+        """Return a copy of the overrides from load, re-reading only when they change."""
+        signature = self.overrides_signature()
+        if signature is None:
+            return None
+        
+        cached = self._overrides_cache
+        if cached is None or cached[0] != signature:
+            cached = (signature, load())
+            self._overrides_cache = cached
+        
+        # Callers edit the overrides they load, so the cached frame is never handed out
+        return cached[1].copy() if cached[1] is not None else None
     
     def save_student_overrides(self, overrides_df: pd.DataFrame) -> None:
         """Save student overrides to local storage."""
+        self._overrides_cache = None
         try:
             # Convert DataFrame to JSON-serializable format
             if overrides_df is not None and len(overrides_df) > 0:
                 data = overrides_df.to_dict('records')
-                with open(self.overrides_file, 'w') as f:
-                    json.dump(data, f, indent=2)
+                _write_json_atomic(self.overrides_file, data)
             else:
                 # Remove file if no overrides
                 if self.overrides_file.exists():
@@ -42,6 +69,17 @@ class LocalStorage:
     
     def load_student_overrides(self) -> Optional[pd.DataFrame]:
         """Load student overrides from local storage."""
+        return self._load_cached(self._read_overrides_file)
+    
+    def overrides_signature(self) -> Optional[Tuple[int, ...]]:
+        """Get a signature of the saved overrides, or None if there are none.
+        
+        The signature changes whenever the overrides are saved, by any process.
+        """
+        # Every save writes a new file and moves it into place
+        return _file_signature(self.overrides_file)
+    
+    def _read_overrides_file(self) -> Optional[pd.DataFrame]:
         try:
             if not self.overrides_file.exists():
                 return None
@@ -52,6 +90,8 @@ class LocalStorage:
             if not data:
                 return None
             
+            import pandas as pd
+
             df = pd.DataFrame(data)
             return df
         except Exception as e:
@@ -61,8 +101,7 @@ class LocalStorage:
     def save_settings(self, settings: Dict[str, Any]) -> None:
         """Save application settings to local storage."""
         try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(settings, f, indent=2)
+            _write_json_atomic(self.settings_file, settings)
         except Exception as e:
             print(f"Error saving settings: {e}")
     
@@ -80,6 +119,7 @@ class LocalStorage:
     
     def clear_student_overrides(self) -> None:
         """Clear all student overrides from local storage."""
+        self._overrides_cache = None
         try:
             if self.overrides_file.exists():
                 self.overrides_file.unlink()
@@ -88,6 +128,7 @@ class LocalStorage:
     
     def clear_all_data(self) -> None:
         """Clear all persisted data."""
+        self._overrides_cache = None
         try:
             if self.overrides_file.exists():
                 self.overrides_file.unlink()
@@ -99,12 +140,289 @@ class LocalStorage:
     def has_student_overrides(self) -> bool:
         """Check if student overrides exist in local storage."""
         return self.overrides_file.exists()
+    
+    def update_student_overrides(self, upserts: Optional[pd.DataFrame],
+                                 deleted_ids: Iterable[str] = ()) -> None:
+        """Insert or update some students' overrides and remove others.
+        
+        The JSON file has no per-student records, so this rewrites the whole file.
+        Updated students move to the end of the file.
+        """
+        import pandas as pd
+
+        deleted_ids = set(deleted_ids)
+        if upserts is not None:
+            upserts = upserts[["Student ID", "Smart Score Threshold", "Minimum Grade"]]
+            deleted_ids.update(upserts["Student ID"])
+        
+        overrides_df = self.load_student_overrides()
+        if overrides_df is not None:
+            overrides_df = overrides_df[~overrides_df["Student ID"].isin(deleted_ids)]
+            upserts = pd.concat([overrides_df, upserts], ignore_index=True)
+        self.save_student_overrides(upserts)
+    
+    def save_student_override(self, student_id: str, smart_score_threshold: Optional[float],
+                              minimum_grade: Optional[float]) -> None:
+        """Insert or update a single student's override in local storage."""
+        import pandas as pd
+
+        self.update_student_overrides(pd.DataFrame({
+            "Student ID": [student_id],
+            "Smart Score Threshold": [smart_score_threshold],
+            "Minimum Grade": [minimum_grade],
+        }))
+    
+    def delete_student_override(self, student_id: str) -> None:
+        """Remove a single student's override from local storage."""
+        self.update_student_overrides(None, [student_id])
+
+
+class SQLiteLocalStorage(LocalStorage):
+    """
+    Local storage that keeps student overrides in an SQLite database indexed by Student ID,
+    so single edits are upserts instead of whole-file rewrites. Settings stay in JSON.
+    Overrides from an existing student_overrides.json are migrated on first use.
+    """
+    
+    def __init__(self, storage_dir: Optional[str] = None):
+        """Initialize SQLite-backed local storage, migrating any JSON overrides."""
+        super().__init__(storage_dir)
+        self.database_file = self.storage_dir / "ixl_grader.db"
+        
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS student_overrides (
+                    student_id TEXT PRIMARY KEY,
+                    smart_score_threshold REAL,
+                    minimum_grade REAL
+                )
+                """
+            )
+            # Names of the one-time migrations already applied to this database
+            conn.execute("CREATE TABLE IF NOT EXISTS migrations (name TEXT PRIMARY KEY)")
+        self._migrate_json_overrides()
+    
+    def _connect(self) -> sqlite3.Connection:
+        # A short-lived connection per call keeps this safe to use from any thread
+        return sqlite3.connect(self.database_file)
+    
+    def _migrate_json_overrides(self) -> None:
+        """Move overrides from the legacy JSON file into the database, once.
+        
+        Batch workers start together and each migrate on startup, so the migration
+        and its marker are written in one transaction that holds the write lock
+        from the start. Workers that get the lock later find the marker and skip it.
+        """
+        if not self.overrides_file.exists():
+            return
+        
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    migrated = conn.execute(
+                        "SELECT 1 FROM migrations WHERE name = ?", (_JSON_MIGRATION,)
+                    ).fetchone()
+                    if migrated is not None:
+                        # Another process got here first; its backup stays untouched
+                        conn.rollback()
+                        return
+                    with open(self.overrides_file, 'r') as f:
+                        data = json.load(f)
+                    if data:
+                        import pandas as pd
+
+                        self._write_overrides(conn, pd.DataFrame(data))
+                    conn.execute(
+                        "INSERT INTO migrations VALUES (?)", (_JSON_MIGRATION,)
+                    )
+                    conn.commit()
+                except BaseException:
+                    conn.rollback()
+                    raise
+        except FileNotFoundError:
+            # Another process migrated the file and moved it aside first
+            return
+        except Exception as e:
+            # Leave the JSON file in place so the migration is retried on the next start
+            print(f"Error migrating student overrides: {e}")
+            return
+        
+        # Keep the original file as a backup instead of deleting it
+        self.overrides_file.replace(self.overrides_file.with_suffix(".json.migrated"))
+    
+    def save_student_overrides(self, overrides_df: pd.DataFrame) -> None:
+        """Replace all student overrides in a single transaction."""
+        try:
+            self._replace_overrides(overrides_df)
+        except Exception as e:
+            print(f"Error saving student overrides: {e}")
+    
+    def _replace_overrides(self, overrides_df: Optional[pd.DataFrame]) -> None:
+        with closing(self._connect()) as conn, conn:
+            self._write_overrides(conn, overrides_df)
+    
+    def _write_overrides(self, conn: sqlite3.Connection,
+                         overrides_df: Optional[pd.DataFrame]) -> None:
+        # Replaces every override within the caller's transaction on conn
+        self._overrides_cache = None
+        records = _override_records(overrides_df)
+        conn.execute("DELETE FROM student_overrides")
+        # The first override for a student wins, as in StudentOverrides
+        conn.executemany(
+            "INSERT OR IGNORE INTO student_overrides VALUES (?, ?, ?)", records
+        )
+    
+    def update_student_overrides(self, upserts: Optional[pd.DataFrame],
+                                 deleted_ids: Iterable[str] = ()) -> None:
+        """Insert or update some students' overrides and remove others in one transaction."""
+        self._overrides_cache = None
+        try:
+            records = _override_records(upserts)
+            with closing(self._connect()) as conn, conn:
+                conn.executemany(
+                    """
+                    INSERT INTO student_overrides VALUES (?, ?, ?)
+                    ON CONFLICT (student_id) DO UPDATE SET
+                        smart_score_threshold = excluded.smart_score_threshold,
+                        minimum_grade = excluded.minimum_grade
+                    """,
+                    records,
+                )
+                conn.executemany(
+                    "DELETE FROM student_overrides WHERE student_id = ?",
+                    [(str(student_id),) for student_id in deleted_ids],
+                )
+        except Exception as e:
+            print(f"Error updating student overrides: {e}")
+    
+    def load_student_overrides(self) -> Optional[pd.DataFrame]:
+        """Load student overrides in the order they were first added."""
+        return self._load_cached(self._read_overrides_database)
+    
+    def overrides_signature(self) -> Optional[Tuple[int, ...]]:
+        """Get a signature of the database file, or None if it is missing."""
+        signature = _file_signature(self.database_file)
+        if signature is None:
+            return None
+        try:
+            with open(self.database_file, 'rb') as f:
+                header = f.read(28)
+        except FileNotFoundError:
+            return None
+        # Commits close together can keep the mtime and size, but SQLite counts
+        # every commit in the file change counter at offset 24 of its header
+        return signature + (int.from_bytes(header[24:28], "big"),)
+    
+    def _read_overrides_database(self) -> Optional[pd.DataFrame]:
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(
+                    "SELECT student_id, smart_score_threshold, minimum_grade "
+                    "FROM student_overrides ORDER BY rowid"
+                ).fetchall()
+            
+            if not rows:
+                return None
+            
+            import pandas as pd
+
+            return pd.DataFrame(
+                rows, columns=["Student ID", "Smart Score Threshold", "Minimum Grade"]
+            )
+        except Exception as e:
+            print(f"Error loading student overrides: {e}")
+            return None
+    
+    def clear_student_overrides(self) -> None:
+        """Clear all student overrides from local storage."""
+        self._overrides_cache = None
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute("DELETE FROM student_overrides")
+        except Exception as e:
+            print(f"Error clearing student overrides: {e}")
+    
+    def clear_all_data(self) -> None:
+        """Clear all persisted data."""
+        self.clear_student_overrides()
+        try:
+            if self.settings_file.exists():
+                self.settings_file.unlink()
+        except Exception as e:
+            print(f"Error clearing all data: {e}")
+    
+    def has_student_overrides(self) -> bool:
+        """Check if student overrides exist in local storage."""
+        try:
+            with closing(self._connect()) as conn:
+                return conn.execute(
+                    "SELECT EXISTS (SELECT 1 FROM student_overrides)"
+                ).fetchone()[0] == 1
+        except Exception as e:
+            print(f"Error checking student overrides: {e}")
+            return False
+
+
+# Marks the move of student_overrides.json into the database as done
+_JSON_MIGRATION = "student_overrides_json"
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, ...]]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def _override_records(overrides_df: Optional[pd.DataFrame]) -> list:
+    # Rows as (student_id, smart_score_threshold, minimum_grade) with NaN as NULL
+    if overrides_df is None:
+        return []
+    
+    import pandas as pd
+
+    def to_nullable_float(value: Any) -> Optional[float]:
+        return None if value is None or pd.isna(value) else float(value)
+
+    return [
+        (str(student_id), to_nullable_float(threshold), to_nullable_float(minimum))
+        for student_id, threshold, minimum in zip(
+            overrides_df["Student ID"],
+            overrides_df["Smart Score Threshold"],
+            overrides_df["Minimum Grade"],
+        )
+    ]
+
+
+def _write_json_atomic(path: Path, data: Any) -> None:
+    # Write to a temporary file next to the target and rename it into place, so a
+    # crash mid-write leaves the previous file intact rather than a truncated one
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
 
 
-# Global instance for the application
-_local_storage = LocalStorage()
+# Global instance for the application, created on first use so importing this
+# module never touches disk
+_local_storage: Optional[LocalStorage] = None
+_local_storage_lock = threading.Lock()
 
 
 def get_local_storage() -> LocalStorage:
     """Get the global local storage instance."""
+    global _local_storage
+    if _local_storage is None:
+        with _local_storage_lock:
+            if _local_storage is None:
+                _local_storage = SQLiteLocalStorage()
     return _local_storage
\ No newline at end of file
@@ -1,109 +1,707 @@
-import math
+import functools
+import io
+import itertools
+import threading
 from os import PathLike
-from typing import TextIO, Optional
+from typing import BinaryIO, Callable, Iterable, Iterator, TextIO, Optional
 
+import numpy as np
 import pandas as pd
 
-from .student_overrides import StudentOverrides
+from .cache import ReportCache, content_hash
+from .diagnostics import StageRecorder, StageStats
+from .grading_job import GradingJob, get_grading_executor
+from .paging import DEFAULT_PAGE_SIZE, PagedRows
+from .parsing import HAS_PYARROW, read_csv
+from .student_overrides import StudentOverrides, _normalize_id, _normalize_ids
+
+
+# Scores at or above this count as passing in summaries
+PASSING_SCORE = 70
+
+# Columns written by export_report, in order, when present in the report
+EXPORT_COLUMNS = [
+    "Student ID",
+    "Last name",
+    "First name",
+    "SmartScore",
+    "Score",
+]
+
+# Export formats and the field separator each one is written with
+EXPORT_FORMATS = {"csv": ",", "tsv": "\t"}
+
+# Columns searched by text in paged previews
+SEARCH_COLUMNS = ["Student ID", "Last name", "First name"]
+
+# Rows per chunk when streaming a report through grade_stream
+DEFAULT_CHUNK_ROWS = 100_000
+
+# Declared kinds of IXL report columns, applied when a report is loaded:
+# - "label": repeated text such as skill or assignment names, stored as categoricals
+# - "text": mostly distinct text such as IDs and names, stored as compact strings
+#   (or categoricals when a student appears on many rows)
+# - "percentage": whole numbers from 0 to 100, stored as nullable 8-bit integers
+# Text columns not listed here are treated as labels.
+REPORT_SCHEMA = {
+    "Student ID": "text",
+    "Last name": "text",
+    "First name": "text",
+    "Assignment": "label",
+    "Skill": "label",
+    "SmartScore": "percentage",
+}
+
+_STRING_DTYPE = pd.StringDtype("pyarrow" if HAS_PYARROW else "python")
+
+# Rows graded at a time by threshold sweep summaries
+_SWEEP_BLOCK_ROWS = 65536
+
+# 10-point score bands counted by threshold sweep summaries; the last includes 100
+_SCORE_BANDS = [f"{low}-{low + 9}" for low in range(0, 90, 10)] + ["90-100"]
+
+# Code standing in for a missing SmartScore in uint8 SmartScore arrays
+_MISSING_SCORE = 101
 
 
 class Report:
-    def __init__(self):
-        self._csv_path: str | None = None
+    def __init__(
+        self,
+        student_overrides: Optional[StudentOverrides] = None,
+        cache: Optional[ReportCache] = None,
+        parser_engine: Optional[str] = None,
+    ):
         self._report: pd.DataFrame | None = None
-        self._student_overrides: StudentOverrides = StudentOverrides()
+        # CSV parser engine for imports, or None to use the default setting
+        self._parser_engine = parser_engine
+        self._student_overrides: StudentOverrides = (
+            student_overrides if student_overrides is not None else StudentOverrides()
+        )
 
-    def _fix_csv(self) -> None:
-        assert self._csv_path is not None, "CSV path must be set before fixing the CSV."
+        # Parsed and graded reports are shared through the cache by upload content hash
+        self._cache = cache
+        self._content_hash: str | None = None
 
-        with open(self._csv_path, "r", encoding="utf-8") as file:
-            lines = file.readlines()
+        # Bytes saved by compact column types when the report was loaded
+        self._memory_saved = 0
+        # Rows whose column counts were repaired when the report was imported
+        self._rows_repaired = 0
 
-        # Some CSVs from IXL have more columns than expected, likely due to commas in names
-        lines = _fix_column_counts(lines)
+        # Grading inputs aligned with the report rows, kept for incremental regrading
+        self._graded_threshold: float | None = None
+        self._student_ids: pd.Index | None = None
+        self._smart_scores: np.ndarray | None = None
+        self._override_thresholds: np.ndarray | None = None
+        self._minimum_grades: np.ndarray | None = None
+        # Graded count, score sum and passing count, patched as rows are regraded
+        self._score_totals: np.ndarray | None = None
+        # Held while grading, so background jobs and direct grades take turns
+        self._grading_lock = threading.RLock()
+        self._job_lock = threading.Lock()
+        self._grading_job: GradingJob | None = None
 
-        with open(self._csv_path, "w", encoding="utf-8") as file:
-            file.writelines(lines)
+        # Bumped whenever the report or its grades change, so cached exports go stale
+        self._grade_version = 0
+        # Encoded exports keyed by (grade version, columns, format)
+        self._exports: dict[tuple[int, tuple[str, ...], str], bytes] = {}
+        # Searched and sorted pages for previews, cached per grade version
+        self._pages = PagedRows()
+        # Threshold sweep summaries keyed by (overrides fingerprint, thresholds, passing
+        # score). They depend only on the imported rows and the overrides, not on grades.
+        self._sweep_summaries: dict[tuple[str, tuple[float, ...], float], pd.DataFrame] = {}
+        # Timings of the latest import, grade and export stages, while diagnostics are on
+        self._stats = StageRecorder("report")
 
-    def _load_report(self) -> pd.DataFrame:
-        assert (
-            self._csv_path is not None
-        ), "CSV path must be set before loading the report."
-        return pd.read_csv(self._csv_path)
+    def _fix_csv(self, data: bytes) -> BinaryIO:
+        """Repair the raw CSV in memory and return a buffer for the parser."""
+        if not data:
+            raise ValueError("Report CSV is empty.")
+
+        with self._stats.stage("fix_csv") as stage:
+            # Some CSVs from IXL have more columns than expected, likely due to commas in names
+            data, self._rows_repaired, rows = _fix_column_counts(data)
+            stage.set_rows(rows, self._rows_repaired)
+
+        return io.BytesIO(data)
+
+    def _load_report(self, buffer: BinaryIO | TextIO) -> pd.DataFrame:
+        with self._stats.stage("load_report") as stage:
+            report = read_csv(
+                buffer, engine=self._parser_engine, text_columns=["Student ID"]
+            )
+            self._memory_saved = _memory_usage(report)
+
+            # Student IDs are compacted by _clean_ids once they are cleaned
+            report = _apply_schema(report, [c for c in report.columns if c != "Student ID"])
+            stage.set_rows(len(report))
+        return report
 
     def _clean_report(self) -> None:
         assert self._report is not None, "Report must be loaded before cleaning."
 
-        self._report = _clean_ids(self._report)
+        with self._stats.stage("clean_ids") as stage:
+            self._report = _clean_ids(self._report)
+            stage.set_rows(len(self._report))
+
+    def import_report(
+        self, source: str | PathLike | bytes | BinaryIO | TextIO
+    ) -> None:
+        """Import an IXL report from a file path, raw bytes or a file-like buffer.
+
+        The report is repaired in memory, so the source is never rewritten. With a
+        cache, a previously imported upload with the same content is not parsed again.
+        """
+        # Stats of the previous report no longer apply
+        self._stats.clear()
+        with self._stats.stage("import_report") as stage:
+            self._import_report(source)
+            stage.set_rows(len(self._report), self._rows_repaired)
+
+    def _import_report(self, source: str | PathLike | bytes | BinaryIO | TextIO) -> None:
+        data = _read_source(source)
+
+        # A grade still running belongs to the previous report
+        job = self._grading_job
+        if job is not None and not job.is_done():
+            job.cancel()
+            job.wait()
+
+        self._graded_threshold = None
+        self._student_ids = None
+        self._sweep_summaries.clear()
+        self._bump_grade_version()
 
-    def import_report(self, csv_path: str) -> None:
-        self._csv_path = csv_path
-        self._fix_csv()
-        self._report = self._load_report()
+        if self._cache is None:
+            self._report = self._load_report(self._fix_csv(data))
+            self._clean_report()
+            self._memory_saved -= _memory_usage(self._report)
+            return
+
+        self._content_hash = content_hash(data)
+        cache_key = ("report", self._content_hash)
+        cached_report = self._cache.get(cache_key)
+        if cached_report is not None:
+            # Grading adds and edits columns, so never hand out the cached frame itself
+            self._report = cached_report.copy()
+            self._memory_saved = 0
+            self._rows_repaired = 0
+            return
+
+        self._report = self._load_report(self._fix_csv(data))
         self._clean_report()
+        self._memory_saved -= _memory_usage(self._report)
+        self._cache.put(cache_key, self._report.copy(), _memory_usage(self._report))
+
+    def stats(self) -> dict[str, StageStats]:
+        """Get the latest stats of each import, grade and export stage, by stage name.
+
+        Includes the override lookups and imports of the report's overrides manager.
+        Stages are only recorded while diagnostics are enabled; see
+        diagnostics.set_enabled.
+        """
+        return {**self._stats.stats(), **self._student_overrides.stats()}
+
+    def get_rows_repaired(self) -> int:
+        """Get the number of rows whose column counts were repaired on import.
+
+        Zero for cache hits, whose rows were counted when first imported.
+        """
+        return self._rows_repaired
+
+    def get_memory_saved(self) -> int:
+        """Get the bytes saved by compact column types when the report was imported.
+
+        Compared with the column types pandas infers on its own; zero for cache hits.
+        """
+        return self._memory_saved
+
+    def get_row_count(self) -> int:
+        """Get the number of rows in the report."""
+        assert self._report is not None, "Report must be loaded before counting rows."
+        return len(self._report)
 
     def get_df(self) -> pd.DataFrame:
+        """Get a copy of the report that the caller is free to modify."""
         assert (
             self._report is not None
         ), "Report must be loaded before accessing DataFrame."
         return self._report.copy()
 
+    def view(self, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """Get a read-only view of the report, optionally limited to some columns.
+
+        Nothing is copied: the view shares the report's data and reflects later
+        regrades. Writing to it raises instead of changing the report.
+        """
+        assert (
+            self._report is not None
+        ), "Report must be loaded before accessing DataFrame."
+        columns = self._report.columns if columns is None else list(columns)
+        return pd.DataFrame(
+            {column: _read_only_column(self._report[column]) for column in columns},
+            copy=False,
+        )
+
+    def head(self, n: int = 5, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """Get a read-only view of the first n rows, optionally limited to some columns."""
+        return self.view(columns).iloc[:n]
+
+    def get_page(
+        self,
+        page: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        columns: Optional[Iterable[str]] = None,
+        sort_by: Optional[str] = None,
+        ascending: bool = True,
+        search: Optional[str] = None,
+    ) -> tuple[pd.DataFrame, int]:
+        """Get one zero-based page of report rows and the number of rows matching search.
+
+        search finds a Student ID exactly through the Student ID index, or else any
+        Student ID or name containing it, ignoring case. Only the page's rows are
+        copied, and pages are cached until the report is regraded.
+        """
+        assert (
+            self._report is not None
+        ), "Report must be loaded before accessing DataFrame."
+        return self._pages.get_page(
+            self._report,
+            self._grade_version,
+            page,
+            page_size,
+            columns,
+            sort_by,
+            ascending,
+            search,
+            SEARCH_COLUMNS,
+            self._find_student_positions,
+        )
+
+    def _find_student_positions(self, search: str) -> Optional[np.ndarray]:
+        # Grading builds the same index, so it is only built here before the first grade
+        if self._student_ids is None:
+            self._student_ids = pd.Index(_normalize_ids(self._report["Student ID"]))
+        positions = self._student_ids.get_indexer_for([_normalize_id(search)])
+        positions = positions[positions >= 0]
+        return positions if len(positions) > 0 else None
+
     def grade(self, smart_score_threshold: int) -> None:
+        """Grade the report, recomputing only rows whose inputs changed.
+
+        After the first grade, a new global threshold only regrades students without
+        a threshold override, and an override change only regrades that student's rows.
+        """
+        assert self._report is not None, "Report must be loaded before grading."
+        with self._grading_lock, self._stats.stage("grade") as stage:
+            _record_grade(stage, self._grade(smart_score_threshold))
+
+    def grade_async(
+        self, smart_score_threshold: int, chunk_rows: int = DEFAULT_CHUNK_ROWS
+    ) -> GradingJob:
+        """Start grading the report in the background and return the running job.
+
+        A full grade runs chunk_rows rows at a time, so progress and partial results
+        can be read from the job, and it can be cancelled between chunks. A request at
+        the threshold of a job still running returns that job; a request at another
+        threshold cancels it and starts over, so requests never queue up.
+        """
         assert self._report is not None, "Report must be loaded before grading."
+        with self._job_lock:
+            job = self._grading_job
+            if job is not None and not job.is_done() and not job.is_cancelled():
+                if job.smart_score_threshold == smart_score_threshold:
+                    return job
+                job.cancel()
+
+            job = GradingJob(self, smart_score_threshold, chunk_rows)
+            self._grading_job = job
+            get_grading_executor().submit(job.run)
+            return job
+
+    def get_grading_job(self) -> Optional[GradingJob]:
+        """Get the most recent background grading job, or None if none was started."""
+        return self._grading_job
+
+    def _run_grading_job(self, job: GradingJob) -> None:
+        with self._grading_lock, self._stats.stage("grade") as stage:
+            _record_grade(stage, self._grade(job.smart_score_threshold, job))
+
+    def _grade(self, smart_score_threshold: int, job: Optional[GradingJob] = None) -> int:
+        """Grade the rows whose inputs changed and return how many were graded."""
+        changed_ids = self._student_overrides.pop_changes()
+        try:
+            return self._grade_changes(changed_ids, smart_score_threshold, job)
+        except BaseException:
+            # Nothing was regraded, so those students still need it on the next grade
+            self._student_overrides.restore_changes(changed_ids)
+            raise
+
+    def _grade_changes(
+        self,
+        changed_ids: Optional[set[str]],
+        smart_score_threshold: int,
+        job: Optional[GradingJob] = None,
+    ) -> int:
+        if self._graded_threshold is None or changed_ids is None:
+            return self._grade_all(smart_score_threshold, job)
+
+        rows = np.zeros(len(self._report), dtype=bool)
+        if smart_score_threshold != self._graded_threshold:
+            rows |= np.isnan(self._override_thresholds)
+
+        if changed_ids:
+            positions = self._student_ids.get_indexer_for(list(changed_ids))
+            positions = positions[positions >= 0]
+            override_thresholds, minimum_grades = self._student_overrides.get_overrides(
+                self._report["Student ID"].iloc[positions], normalized=True
+            )
+            self._override_thresholds[positions] = override_thresholds
+            self._minimum_grades[positions] = minimum_grades
+            rows[positions] = True
+
+        # Regrading only changed rows is quick, so it is never split into chunks
+        rows = np.flatnonzero(rows)
+        self._regrade_rows(rows, smart_score_threshold)
+        self._graded_threshold = smart_score_threshold
+        if job is not None:
+            job._finish(len(self._report))
+        return len(rows)
+
+    def _grade_all(self, smart_score_threshold: int, job: Optional[GradingJob] = None) -> int:
+        smart_scores = _smart_score_values(self._report["SmartScore"])
+
+        cache_key = None
+        if self._cache is not None:
+            cache_key = (
+                "grades",
+                self._content_hash,
+                float(smart_score_threshold),
+                self._student_overrides.get_fingerprint(),
+            )
+        cached_grades = self._cache.get(cache_key) if cache_key is not None else None
+
+        if cached_grades is not None:
+            student_ids, override_thresholds, minimum_grades, scores = cached_grades
+            # Regrading edits these arrays in place, so keep the cached ones intact
+            override_thresholds = override_thresholds.copy()
+            minimum_grades = minimum_grades.copy()
+            scores = scores.copy()
+        else:
+            student_ids = self._student_ids
+            if student_ids is None:
+                student_ids = pd.Index(_normalize_ids(self._report["Student ID"]))
 
-        def assign_grade(row):
-            smart_score = row["SmartScore"]
-            student_id = row["Student ID"]
+            if job is None:
+                # Look up the overrides for the whole Student ID column at once
+                override_thresholds, minimum_grades = (
+                    self._student_overrides.get_overrides(
+                        self._report["Student ID"], normalized=True
+                    )
+                )
+                scores = _compute_grades(
+                    smart_scores,
+                    override_thresholds,
+                    minimum_grades,
+                    smart_score_threshold,
+                )
+            else:
+                graded = self._grade_chunks(smart_scores, smart_score_threshold, job)
+                if graded is None:
+                    # The overrides changes were consumed, so grade everything next time
+                    self._graded_threshold = None
+                    return job.get_rows_graded()
+                override_thresholds, minimum_grades, scores = graded
 
-            if smart_score is None or pd.isna(smart_score):
-                return math.nan
+            if cache_key is not None:
+                self._cache.put(
+                    cache_key,
+                    (
+                        student_ids,
+                        override_thresholds.copy(),
+                        minimum_grades.copy(),
+                        scores.copy(),
+                    ),
+                    student_ids.memory_usage(deep=True) + 3 * scores.nbytes,
+                )
 
-            # Get student-specific overrides
-            override_threshold, minimum_grade = self._student_overrides.get_override(
-                student_id
+        # Nothing on the report changes until every row is graded
+        self._student_ids = student_ids
+        self._smart_scores = smart_scores
+        self._override_thresholds = override_thresholds
+        self._minimum_grades = minimum_grades
+        self._report["Score"] = scores
+        self._score_totals = _score_totals(scores)
+        self._graded_threshold = smart_score_threshold
+        self._bump_grade_version()
+        if job is not None:
+            job._finish(len(self._report))
+        return len(self._report)
+
+    def _grade_chunks(
+        self, smart_scores: np.ndarray, smart_score_threshold: int, job: GradingJob
+    ) -> Optional[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Grade every row chunk by chunk for job, or return None if it is cancelled."""
+        total = len(smart_scores)
+        override_thresholds = np.empty(total)
+        minimum_grades = np.empty(total)
+        scores = job._start(total)
+        student_ids = self._report["Student ID"]
+
+        for start in range(0, total, job.chunk_rows):
+            if job.is_cancelled():
+                return None
+            rows = slice(start, min(start + job.chunk_rows, total))
+            override_thresholds[rows], minimum_grades[rows] = (
+                self._student_overrides.get_overrides(
+                    student_ids.iloc[rows], normalized=True
+                )
+            )
+            scores[rows] = _compute_grades(
+                smart_scores[rows],
+                override_thresholds[rows],
+                minimum_grades[rows],
+                smart_score_threshold,
             )
+            job._advance(rows.stop)
+
+        # The job's scores stay readable as partial results, so the report keeps a copy
+        return override_thresholds, minimum_grades, scores.copy()
+
+    def _export_columns(self) -> list[str]:
+        return [c for c in EXPORT_COLUMNS if c in self._report.columns]
+
+    def _partial_results(self, scores: np.ndarray) -> pd.DataFrame:
+        """Get the export columns of the first rows, with scores graded so far."""
+        columns = [c for c in self._export_columns() if c != "Score"]
+        results = self.head(len(scores), columns=columns)
+        return results.assign(Score=_read_only_array(scores))
 
-            # Use override threshold if available, otherwise use global threshold
-            threshold = (
-                override_threshold
-                if override_threshold is not None
-                else smart_score_threshold
+    def _regrade_rows(self, rows: np.ndarray, smart_score_threshold: int) -> None:
+        if len(rows) == 0:
+            return
+
+        scores = _compute_grades(
+            self._smart_scores[rows],
+            self._override_thresholds[rows],
+            self._minimum_grades[rows],
+            smart_score_threshold,
+        )
+
+        score_column = self._report.columns.get_loc("Score")
+        previous_scores = self._report.iloc[rows, score_column].to_numpy(dtype=float)
+        self._report.iloc[rows, score_column] = scores
+        self._score_totals += _score_totals(scores) - _score_totals(previous_scores)
+        self._bump_grade_version()
+
+    def _bump_grade_version(self) -> None:
+        self._grade_version += 1
+        self._exports.clear()
+        self._pages.clear()
+
+    def get_score_summary(self) -> dict[str, float | None]:
+        """Get the results summary metrics for the graded report.
+
+        Average Score and Pass Rate are None when no student has a SmartScore.
+        """
+        assert (
+            self._graded_threshold is not None
+        ), "Report must be graded before summarizing scores."
+
+        graded, total, passing = self._score_totals
+        return {
+            "Total Students": len(self._report),
+            "Graded Students": int(graded),
+            "Average Score": total / graded if graded > 0 else None,
+            "Pass Rate": 100 * passing / graded if graded > 0 else None,
+        }
+
+    def grade_sweep(self, thresholds: Iterable[int]) -> pd.DataFrame:
+        """Grade every student at each of the given global SmartScore thresholds.
+
+        Per-student overrides are respected and the report itself is left unchanged.
+        Returns a students x thresholds DataFrame aligned with the report rows.
+        """
+        assert self._report is not None, "Report must be loaded before grading."
+
+        thresholds = np.asarray(list(thresholds), dtype=float)
+        grades = self._sweep_grades(thresholds, slice(None))
+
+        return pd.DataFrame(grades, index=self._report.index, columns=thresholds)
+
+    def grade_sweep_summary(
+        self, thresholds: Iterable[int], passing_score: float = PASSING_SCORE
+    ) -> pd.DataFrame:
+        """Summarize the class grade distribution at each global SmartScore threshold.
+
+        Returns one row per threshold with the graded student count, average score,
+        pass rate and a count of scores in each 10-point band (the last band includes 100).
+        Summaries are reused until another report is imported or the overrides change.
+        """
+        assert self._report is not None, "Report must be loaded before grading."
+
+        thresholds = np.asarray(list(thresholds), dtype=float)
+        fingerprint = self._student_overrides.get_fingerprint()
+        key = (fingerprint, tuple(thresholds.tolist()), float(passing_score))
+        summary = self._sweep_summaries.get(key)
+        if summary is None:
+            summary = self._sweep_summary(thresholds, passing_score)
+            # Summaries for earlier overrides will not be asked for again
+            if any(cached[0] != fingerprint for cached in self._sweep_summaries):
+                self._sweep_summaries.clear()
+            self._sweep_summaries[key] = summary
+        return summary.copy()
+
+    def _sweep_summary(self, thresholds: np.ndarray, passing_score: float) -> pd.DataFrame:
+        graded = np.zeros(len(thresholds))
+        total = np.zeros(len(thresholds))
+        passing = np.zeros(len(thresholds))
+        bands = np.zeros((len(_SCORE_BANDS), len(thresholds)))
+
+        # Sweep in row blocks so the students x thresholds matrix stays small
+        for start in range(0, len(self._report), _SWEEP_BLOCK_ROWS):
+            grades = self._sweep_grades(
+                thresholds, slice(start, start + _SWEEP_BLOCK_ROWS)
             )
+            is_graded = ~np.isnan(grades)
+            graded += is_graded.sum(axis=0)
+            total += np.where(is_graded, grades, 0).sum(axis=0)
+            passing += (grades >= passing_score).sum(axis=0)
+            band_index = np.minimum(grades // 10, len(_SCORE_BANDS) - 1)
+            for band in range(len(_SCORE_BANDS)):
+                bands[band] += (band_index == band).sum(axis=0)
 
-            # Calculate grade based on threshold
-            calculated_grade = float(
-                round(100 * min(smart_score, threshold) / threshold)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            summary = pd.DataFrame(
+                {
+                    "Graded Students": graded.astype(int),
+                    "Average Score": total / graded,
+                    "Pass Rate": 100 * passing / graded,
+                },
+                index=pd.Index(thresholds, name="SmartScore Threshold"),
             )
+        for band, label in enumerate(_SCORE_BANDS):
+            summary[label] = bands[band].astype(int)
 
-            # Apply minimum grade override if set and grade is lower
-            if minimum_grade is not None and calculated_grade < minimum_grade:
-                calculated_grade = minimum_grade
+        return summary
 
-            return calculated_grade
+    def _sweep_grades(self, thresholds: np.ndarray, rows: slice) -> np.ndarray:
+        """Grade a block of report rows at every threshold by broadcasting."""
+        report = self._report.iloc[rows]
+        override_thresholds, minimum_grades = self._student_overrides.get_overrides(
+            report["Student ID"], normalized=True
+        )
 
-        self._report["Score"] = self._report.apply(assign_grade, axis=1)
+        return _compute_grades(
+            _smart_score_values(report["SmartScore"])[:, np.newaxis],
+            override_thresholds[:, np.newaxis],
+            minimum_grades[:, np.newaxis],
+            thresholds[np.newaxis, :],
+        )
 
     def export_report(self, output: str | PathLike | TextIO) -> None:
         assert self._report is not None, "Report must be loaded before exporting."
-        # Restrict export to only the requested columns
-        allowed_cols = [
-            "Student ID",
-            "Last name",
-            "First name",
-            "SmartScore",
-            "Score",
-        ]
-        existing_cols = [c for c in allowed_cols if c in self._report.columns]
-        export_df = self._report[existing_cols].copy()
-        export_df.to_csv(output, index=False)
+        with self._stats.stage("export_report") as stage:
+            # Restrict export to only the requested columns
+            self.view(self._export_columns()).to_csv(output, index=False)
+            stage.set_rows(len(self._report))
+
+    def get_grade_version(self) -> int:
+        """Get a counter that changes whenever the report is imported or regraded."""
+        return self._grade_version
+
+    def export_bytes(
+        self, columns: Optional[Iterable[str]] = None, export_format: str = "csv"
+    ) -> bytes:
+        """Get the report encoded as UTF-8 bytes, ready to download.
+
+        Defaults to the EXPORT_COLUMNS present in the report. The bytes are built
+        once per grade version, columns and format, and reused until the report is
+        regraded.
+        """
+        key = self._export_key(columns, export_format)
+        data = self._exports.get(key)
+        if data is None:
+            with self._stats.stage("export_bytes") as stage:
+                data = (
+                    self.view(key[1])
+                    .to_csv(index=False, sep=EXPORT_FORMATS[export_format])
+                    .encode("utf-8")
+                )
+                stage.set_rows(len(self._report))
+            self._exports[key] = data
+        return data
+
+    def has_cached_export(
+        self, columns: Optional[Iterable[str]] = None, export_format: str = "csv"
+    ) -> bool:
+        """Check whether export_bytes would return cached bytes without building them."""
+        return self._export_key(columns, export_format) in self._exports
+
+    def _export_key(
+        self, columns: Optional[Iterable[str]], export_format: str
+    ) -> tuple[int, tuple[str, ...], str]:
+        assert self._report is not None, "Report must be loaded before exporting."
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(
+                f"Unknown export format {export_format!r}; "
+                f"expected one of {', '.join(EXPORT_FORMATS)}"
+            )
+        if columns is None:
+            columns = self._export_columns()
+        return (self._grade_version, tuple(columns), export_format)
+
+    def grade_stream(
+        self,
+        csv_path: str | PathLike,
+        output: str | PathLike | TextIO,
+        smart_score_threshold: int,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    ) -> int:
+        """Repair, clean, grade and export an IXL report in fixed-size chunks.
+
+        Memory stays bounded by chunk_rows no matter how large the export is. The
+        input file is left untouched and the report is not kept on this object.
+        Student IDs are read as text and SmartScores as floats before compacting, so
+        chunks of whole-number SmartScores parse and export them the same way.
+
+        Returns:
+            The number of rows graded
+        """
+        if isinstance(output, (str, PathLike)):
+            with open(output, "w", encoding="utf-8", newline="") as sink:
+                return self.grade_stream(csv_path, sink, smart_score_threshold, chunk_rows)
+
+        rows = 0
+        with open(csv_path, "r", encoding="utf-8") as file:
+            for chunk in _iter_report_chunks(file, chunk_rows):
+                chunk = _clean_ids(_apply_schema(chunk, ["SmartScore"]))
+                override_thresholds, minimum_grades = (
+                    self._student_overrides.get_overrides(
+                        chunk["Student ID"], normalized=True
+                    )
+                )
+                chunk["Score"] = _compute_grades(
+                    _smart_score_values(chunk["SmartScore"]),
+                    override_thresholds,
+                    minimum_grades,
+                    smart_score_threshold,
+                )
+
+                existing_cols = [c for c in EXPORT_COLUMNS if c in chunk.columns]
+                chunk[existing_cols].to_csv(output, index=False, header=rows == 0)
+                rows += len(chunk)
+
+        return rows
 
     def get_student_overrides(self) -> StudentOverrides:
         """Get the student overrides manager."""
         return self._student_overrides
 
-    def import_student_overrides(self, csv_path: str) -> None:
-        """Import student overrides from CSV file."""
-        self._student_overrides.import_overrides(csv_path)
+    def import_student_overrides(
+        self, source: str | PathLike | bytes | BinaryIO | TextIO
+    ) -> None:
+        """Import student overrides from a CSV file path, raw bytes or buffer."""
+        self._student_overrides.import_overrides(source)
 
     def set_student_override(
         self,
@@ -127,33 +725,435 @@ class Report:
         return self._student_overrides.has_overrides()
 
 
-def _fix_column_counts(lines: list[str]) -> list[str]:
-    expected_column_count = lines[0].count(",") + 1
+def _record_grade(stage, rows_graded: int) -> None:
+    # Refreshes with nothing to regrade would hide the stats of the last real grade
+    if rows_graded > 0:
+        stage.set_rows(rows_graded)
+    else:
+        stage.discard()
+
+
+def _read_source(source: str | PathLike | bytes | BinaryIO | TextIO) -> bytes:
+    if isinstance(source, bytes):
+        return source
+    if isinstance(source, (str, PathLike)):
+        with open(source, "rb") as file:
+            return file.read()
+
+    data = source.read()
+    return data.encode("utf-8") if isinstance(data, str) else data
+
+
+def _fix_column_counts(data: bytes) -> tuple[bytes, int, int]:
+    """Repair rows with more columns than the header.
+
+    Rows are located in bulk with NumPy over the raw bytes, treating commas and line
+    breaks inside quoted fields as text. Only the rows found are repaired, so clean
+    files are returned as is.
+
+    Returns:
+        Tuple of (repaired CSV bytes, number of rows repaired, number of rows)
+    """
+    # Commas, quotes and line breaks are single bytes that never occur inside
+    # multi-byte UTF-8 characters, so the raw bytes can be scanned directly
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    is_comma = buffer == ord(",")
+    is_newline = buffer == ord("\n")
+
+    if b'"' in data:
+        in_quotes = _quoted_bytes(data, buffer)
+        is_comma &= in_quotes == 0
+        is_newline &= in_quotes == 0
+
+    # Row i spans [row_bounds[i], row_bounds[i + 1]), including its line break
+    row_bounds = np.flatnonzero(is_newline) + 1
+    if len(row_bounds) == 0 or row_bounds[-1] != len(data):
+        row_bounds = np.append(row_bounds, len(data))
+    row_bounds = np.concatenate(([0], row_bounds))
+
+    comma_counts = np.diff(np.searchsorted(np.flatnonzero(is_comma), row_bounds))
+    # Not counting the header
+    row_count = len(comma_counts) - 1
+
+    # Skip the header
+    malformed_rows = np.flatnonzero(comma_counts[1:] > comma_counts[0]) + 1
+    if len(malformed_rows) == 0:
+        return data, 0, row_count
+
+    expected_column_count = int(comma_counts[0]) + 1
+    name_index = _name_column_index(data[: row_bounds[1]].decode("utf-8"))
 
-    # Naively fix lines with too many columns by merging a blank cell in the middle of the names
-    for idx, line in enumerate(lines):
-        # Skip the header
-        if idx == 0:
+    pieces = []
+    previous_end = 0
+    for row in malformed_rows:
+        start, end = row_bounds[row], row_bounds[row + 1]
+        pieces.append(data[previous_end:start])
+        line = data[start:end].decode("utf-8")
+        pieces.append(
+            _fix_column_count(line, expected_column_count, name_index).encode("utf-8")
+        )
+        previous_end = end
+    pieces.append(data[previous_end:])
+
+    return b"".join(pieces), len(malformed_rows), row_count
+
+
+def _quoted_bytes(data: bytes, buffer: np.ndarray) -> np.ndarray:
+    """Flag the bytes inside quoted fields with 1, as pandas' C parser reads them.
+
+    A quote only opens a quoted field at the start of a field, or right after the
+    quote closing one (an escaped quote); elsewhere, as in O"Neil, it is text.
+    """
+    quotes = np.flatnonzero(buffer == ord('"'))
+    # Usually every quote opens or closes a field, so a byte is inside a quoted field
+    # when an odd number of quotes precede it. That holds while each opening quote,
+    # every other one, starts a field or follows the quote that closed a field.
+    openings = quotes[::2]
+    before_openings = buffer[openings[openings > 0] - 1]
+    if not np.isin(before_openings, [ord(","), ord("\n"), ord('"')]).all():
+        quotes = _field_quotes(data, quotes)
+
+    toggles = np.zeros(len(buffer), dtype=np.uint8)
+    toggles[quotes] = 1
+    return np.bitwise_xor.accumulate(toggles)
+
+
+def _field_quotes(data: bytes, quotes: np.ndarray) -> np.ndarray:
+    # Walk the quotes in order to drop those inside unquoted fields; only files with
+    # such stray quotes get here
+    field_quotes = []
+    in_quotes = False
+    closed_at = -2
+    for position in quotes.tolist():
+        if in_quotes:
+            in_quotes = False
+            closed_at = position
+        elif position == 0 or data[position - 1] in b",\n" or position - 1 == closed_at:
+            in_quotes = True
+        else:
             continue
+        field_quotes.append(position)
+    return np.array(field_quotes, dtype=np.intp)
+
 
-        # From IXL, names come before other fields that could also be blank. We'll assume the first
-        # blank cell in a row with too many columns is part of the name.
-        column_count = line.count(",") + 1
-        if column_count > expected_column_count:
-            parts = line.split(",")
-            first_blank_index = parts.index("")
+def _fix_column_count(
+    line: str, expected_column_count: int, name_index: int = 1
+) -> str:
+    # Most rows have no quotes and the right number of columns
+    if '"' not in line and line.count(",") < expected_column_count:
+        return line
+
+    parts = _split_fields(line)
+    if len(parts) <= expected_column_count:
+        return line
+
+    merged_name = False
+    while len(parts) > expected_column_count:
+        # From IXL, names come before other fields that could also be blank. We'll assume the
+        # first blank cell after the Student ID in a row with too many columns is part of the name.
+        if "" in parts[1:]:
+            first_blank_index = parts.index("", 1)
             # Merge the blank cell with the previous cell (part of the name)
             parts[first_blank_index - 1] += " " + parts[first_blank_index]
             del parts[first_blank_index]
-            lines[idx] = ",".join(parts)
+        else:
+            # Without a blank cell, the comma is inside the name itself
+            parts[name_index] += "," + parts[name_index + 1]
+            del parts[name_index + 1]
+            merged_name = True
 
-    return lines
+    if merged_name:
+        # Quote the merged name so its commas stay inside the field
+        name = parts[name_index].strip('"').replace('"', '""')
+        parts[name_index] = f'"{name}"'
 
+    return ",".join(parts)
 
-def _clean_ids(report: pd.DataFrame) -> pd.DataFrame:
-    # Some Student IDs are incorrectly formatted as "ID0123456789" instead of "0123456789"
-    report["Student ID"] = (
-        report["Student ID"].astype(str).str.lstrip("ID").astype(str).str.strip()
+
+def _split_fields(line: str) -> list[str]:
+    # Split at commas outside quoted fields, keeping each field's raw text
+    fields = []
+    field_start = 0
+    in_quotes = False
+    closed_at = -2
+    for index, char in enumerate(line):
+        if char == '"':
+            # Quotes only open a field at its start or as an escaped quote, like
+            # pandas' C parser; elsewhere they are text
+            if in_quotes:
+                in_quotes = False
+                closed_at = index
+            elif index == field_start or index - 1 == closed_at:
+                in_quotes = True
+        elif char == "," and not in_quotes:
+            fields.append(line[field_start:index])
+            field_start = index + 1
+    fields.append(line[field_start:])
+    return fields
+
+
+def _name_column_index(header: str) -> int:
+    # Overflowing names without a blank cell are merged into the last name
+    fields = [field.strip().strip('"') for field in _split_fields(header)]
+    return fields.index("Last name") if "Last name" in fields[:-1] else 1
+
+
+def _iter_report_chunks(file: TextIO, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    """Lazily repair and parse an IXL report, chunk_rows lines at a time."""
+    header = file.readline()
+    if not header:
+        raise ValueError("Report CSV is empty.")
+    expected_column_count = len(_split_fields(header))
+    name_index = _name_column_index(header)
+
+    repaired_lines = (
+        _fix_column_count(line, expected_column_count, name_index) for line in file
     )
+    while chunk_lines := list(itertools.islice(repaired_lines, chunk_rows)):
+        yield pd.read_csv(
+            io.StringIO(header + "".join(chunk_lines)),
+            dtype={"Student ID": str, "SmartScore": float},
+        )
+
+
+def _clean_ids(report: pd.DataFrame) -> pd.DataFrame:
+    # Cleaned like override Student IDs, so that both match
+    report["Student ID"] = _normalize_ids(report["Student ID"])
+
+    return _apply_schema(report, ["Student ID"])
+
+
+def _apply_schema(report: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+    """Convert the given columns to the compact dtypes declared in REPORT_SCHEMA."""
+    for column in columns:
+        kind = REPORT_SCHEMA.get(column)
+        values = report[column]
+
+        if kind == "percentage":
+            report[column] = _compact_percentages(values)
+        elif kind is None and not pd.api.types.is_object_dtype(values):
+            # Undeclared numeric columns are left as parsed
+            continue
+        elif kind == "text" and values.nunique() > len(values) // 2:
+            report[column] = values.astype(_STRING_DTYPE)
+        else:
+            # Repeated text is stored once per distinct value
+            report[column] = values.astype("category")
 
     return report
+
+
+def _compact_percentages(values: pd.Series) -> pd.Series:
+    # Anything other than whole numbers from 0 to 100 keeps its parsed dtype
+    if not pd.api.types.is_numeric_dtype(values):
+        return values
+    present = values.dropna()
+    if not (
+        (present >= 0).all() and (present <= 100).all() and (present % 1 == 0).all()
+    ):
+        return values
+    return values.astype("UInt8")
+
+
+def _memory_usage(report: pd.DataFrame) -> int:
+    return int(report.memory_usage(deep=True).sum())
+
+
+def _read_only_column(column: pd.Series) -> pd.Series:
+    # Wrap the column's data without copying it, marking the underlying arrays
+    # read-only so writes through the wrapper fail instead of reaching the report
+    values = column.array
+    if isinstance(column.dtype, np.dtype):
+        data = _read_only_array(column.to_numpy(copy=False))
+    elif isinstance(values, pd.Categorical):
+        # Categorical.codes is already a read-only view
+        data = pd.Categorical.from_codes(values.codes, dtype=values.dtype, validate=False)
+    elif isinstance(
+        values, (pd.arrays.IntegerArray, pd.arrays.FloatingArray, pd.arrays.BooleanArray)
+    ):
+        data = type(values)(_read_only_array(values._data), _read_only_array(values._mask))
+    elif isinstance(values, pd.arrays.ArrowExtensionArray):
+        # Arrow buffers are immutable, so writes would only replace the wrapper's data;
+        # the wrapper refuses them instead so they fail like writes to NumPy data
+        data = _read_only_arrow_type(type(values))(values._pa_array)
+    elif isinstance(values, pd.arrays.StringArray):
+        data = values._from_backing_data(_read_only_array(values._ndarray))
+    else:
+        data = values.copy()
+    return pd.Series(data, index=column.index, name=column.name, copy=False)
+
+
+def _read_only_array(values: np.ndarray) -> np.ndarray:
+    view = values.view()
+    view.flags.writeable = False
+    return view
+
+
+@functools.cache
+def _read_only_arrow_type(array_type: type) -> type:
+    """Subclass an Arrow-backed array type to reject item assignment.
+
+    Slices stay read-only like NumPy views, while copies and concatenations get the
+    original, writable type.
+    """
+
+    def __setitem__(self, key, value) -> None:
+        raise ValueError("assignment destination is read-only")
+
+    def copy(self):
+        return array_type(self._pa_array)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat):
+        return array_type._concat_same_type(
+            [array_type(array._pa_array) for array in to_concat]
+        )
+
+    return type(
+        f"ReadOnly{array_type.__name__}",
+        (array_type,),
+        {"__setitem__": __setitem__, "copy": copy, "_concat_same_type": _concat_same_type},
+    )
+
+
+def _score_totals(scores: np.ndarray) -> np.ndarray:
+    is_graded = ~np.isnan(scores)
+    return np.array(
+        [
+            is_graded.sum(),
+            scores[is_graded].sum(),
+            (scores >= PASSING_SCORE).sum(),
+        ],
+        dtype=float,
+    )
+
+
+def _smart_score_values(smart_scores: pd.Series) -> np.ndarray:
+    # SmartScores compacted to whole numbers from 0 to 100 are kept as uint8 codes,
+    # with missing ones coded as _MISSING_SCORE, so every row is graded from the
+    # lookup table; anything else is graded arithmetically as floats
+    if isinstance(smart_scores.dtype, pd.UInt8Dtype):
+        return smart_scores.to_numpy(dtype=np.uint8, na_value=_MISSING_SCORE)
+    return smart_scores.to_numpy(dtype=float, na_value=np.nan)
+
+
+def _compute_grades(
+    smart_scores: np.ndarray,
+    override_thresholds: np.ndarray,
+    minimum_grades: np.ndarray,
+    smart_score_threshold: float | np.ndarray,
+) -> np.ndarray:
+    """Grade SmartScores column-wise.
+
+    SmartScores are uint8 codes from _smart_score_values or floats. Override
+    thresholds and minimum grades are NaN where a student has no override. Missing
+    SmartScores stay NaN and are never raised to a minimum grade. All inputs
+    broadcast, so an array of global thresholds grades every student at each of them.
+    """
+    if smart_scores.dtype == np.uint8 and _in_table(smart_score_threshold):
+        grades = _lookup_grades(smart_scores, override_thresholds, smart_score_threshold)
+    else:
+        if smart_scores.dtype == np.uint8:
+            smart_scores = _score_code_values(smart_scores)
+        thresholds = np.where(
+            np.isnan(override_thresholds), smart_score_threshold, override_thresholds
+        )
+        if np.any((thresholds == 0) & ~np.isnan(smart_scores)):
+            raise ZeroDivisionError("SmartScore threshold must be greater than zero")
+        grades = _calculate_grades(smart_scores, thresholds)
+
+    # NaN minimum grades never compare lower, so those grades are left untouched
+    return np.where(grades < minimum_grades, minimum_grades, grades)
+
+
+def _calculate_grades(
+    smart_scores: np.ndarray,
+    thresholds: np.ndarray,
+    rounding: Callable[[np.ndarray], np.ndarray] = np.round,
+) -> np.ndarray:
+    # np.round rounds half to even, like the built-in round
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return rounding(100 * np.minimum(smart_scores, thresholds) / thresholds)
+
+
+def _lookup_grades(
+    score_codes: np.ndarray,
+    override_thresholds: np.ndarray,
+    smart_score_threshold: float | np.ndarray,
+) -> np.ndarray:
+    """Grade uint8 SmartScore codes by gathering from the lookup table.
+
+    Every row is graded from the table columns of the global thresholds, which are
+    whole numbers from 0 to 100, so a sweep copies whole rows of grades. Rows with an
+    override threshold are then regraded at it, arithmetically when it is outside
+    the table. Missing SmartScores gather NaN from the table's last row.
+    """
+    table = _grade_lookup_table()
+    global_thresholds = np.asarray(smart_score_threshold, dtype=float)
+    has_override = ~np.isnan(override_thresholds)
+    if np.any(global_thresholds == 0) and np.any(
+        ~has_override & (score_codes != _MISSING_SCORE)
+    ):
+        raise ZeroDivisionError("SmartScore threshold must be greater than zero")
+
+    # take gathers fastest with a native intp index, which NumPy would otherwise
+    # convert from a narrower one on every gather
+    codes = score_codes.ravel().astype(np.intp)
+    columns = table[:, global_thresholds.astype(np.intp)]
+    grades = columns.take(codes, axis=0).reshape(
+        np.broadcast_shapes(score_codes.shape, global_thresholds.shape)
+    )
+
+    rows = np.flatnonzero(has_override)
+    if len(rows) == 0:
+        return grades
+    thresholds = override_thresholds.ravel()[rows]
+    codes = codes[rows]
+    if np.any((thresholds == 0) & (codes != _MISSING_SCORE)):
+        raise ZeroDivisionError("SmartScore threshold must be greater than zero")
+
+    in_table = _in_table(thresholds, elementwise=True)
+    override_grades = np.empty(len(rows))
+    override_grades[in_table] = table[
+        codes[in_table], thresholds[in_table].astype(np.intp)
+    ]
+    override_grades[~in_table] = _calculate_grades(
+        _score_code_values(codes[~in_table]), thresholds[~in_table]
+    )
+    # Overrides replace every global threshold of a row
+    grades[rows] = override_grades.reshape((-1,) + (1,) * (grades.ndim - 1))
+    return grades
+
+
+def _in_table(
+    thresholds: float | np.ndarray, elementwise: bool = False
+) -> bool | np.ndarray:
+    """Check whether thresholds are whole numbers from 0 to 100, columns of the table."""
+    thresholds = np.asarray(thresholds, dtype=float)
+    in_table = (thresholds % 1 == 0) & (thresholds >= 0) & (thresholds <= 100)
+    return in_table if elementwise else bool(in_table.all())
+
+
+def _score_code_values(score_codes: np.ndarray) -> np.ndarray:
+    # Decode uint8 SmartScore codes to floats for arithmetic grading
+    return np.where(score_codes == _MISSING_SCORE, np.nan, score_codes)
+
+
+@functools.cache
+def _grade_lookup_table(
+    rounding: Callable[[np.ndarray], np.ndarray] = np.round,
+) -> np.ndarray:
+    """Grades for every SmartScore code (rows) and whole threshold from 0 to 100 (columns).
+
+    Memoized per rounding rule. Rows 0 to 100 are whole SmartScores and the last row,
+    for _MISSING_SCORE, is NaN. Column 0 is NaN since a zero threshold has no grade.
+    The table is tiny (102 x 101 floats), so gathering from it stays cache resident.
+    """
+    smart_scores, thresholds = np.meshgrid(
+        np.append(np.arange(101, dtype=float), np.nan),
+        np.arange(101, dtype=float),
+        indexing="ij",
+    )
+    table = _calculate_grades(smart_scores, thresholds, rounding)
+    table.setflags(write=False)
+    return table
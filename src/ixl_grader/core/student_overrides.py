@@ -1,56 +1,397 @@
+import atexit
+import hashlib
+import io
+import threading
+import weakref
+from contextlib import contextmanager
+from os import PathLike
+
+import numpy as np
 import pandas as pd
-from typing import Optional, Dict, Tuple
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Dict, Set, TextIO, Tuple
+
+from .diagnostics import StageRecorder, StageStats
+from .override_store import get_shared_override_store
+from .paging import DEFAULT_PAGE_SIZE, PagedRows
+from .parsing import read_csv
 
-from .persistence import get_local_storage
+# Seconds to wait after the last edit before writing pending edits to local storage
+FLUSH_DELAY = 0.5
+
+# Instances with edits not yet written, flushed when the interpreter exits
+_unflushed: "weakref.WeakSet[StudentOverrides]" = weakref.WeakSet()
 
 
 class StudentOverrides:
     """Manages student-specific grade minimum and smart score threshold overrides."""
     
-    def __init__(self):
+    def __init__(self, persist: bool = True, flush_delay: float = FLUSH_DELAY):
+        """Create an overrides manager.
+        
+        With persist=False, overrides live only in memory and are neither loaded from
+        nor saved to local storage. Otherwise they come from the process-wide shared
+        override store when first needed, and are only copied once this manager edits
+        them. Single-student edits are written behind:
+        they are saved together once no edit has been made for flush_delay seconds,
+        on flush(), or when a batch() block exits. Imports and clears save immediately.
+        Changes saved by other managers are picked up on the next call, and reported
+        by pop_changes like local edits.
+        """
         self._overrides: Optional[pd.DataFrame] = None
-        self._local_storage = get_local_storage()
-        # Load existing overrides from local storage on initialization
-        self._load_from_local_storage()
+        # Maps a cleaned Student ID to the label of its row in _overrides
+        self._index: Dict[str, int] = {}
+        # Student IDs changed since the last pop_changes call, or None if all may have
+        self._changed_ids: Optional[Set[str]] = None
+        # Bumped on every change; the fingerprint is memoized per version
+        self._version = 0
+        self._fingerprint: Optional[Tuple[int, str]] = None
+        self._persist = persist
+        self._loaded = False
+        self._store = None
+        # Whether _overrides and _index are the store's snapshot, to be copied before edits
+        self._shared = False
+        # Changes published by the store as (store version, Student IDs or None), not yet applied
+        self._store_changes: List[Tuple[int, Optional[Set[str]]]] = []
+        self._store_changes_lock = threading.Lock()
+        # Guards the overrides against the flush timer thread
+        self._lock = threading.RLock()
+        self._flush_delay = flush_delay
+        self._flush_timer: Optional[threading.Timer] = None
+        self._batch_depth = 0
+        # Student IDs with edits not yet saved, and whether everything needs saving
+        self._pending_ids: Set[str] = set()
+        self._pending_all = False
+        # Searched and sorted pages for previews, cached per version
+        self._pages = PagedRows()
+        # Timings of the latest import, lookup and save, while diagnostics are on
+        self._stats = StageRecorder("student_overrides")
+    
+    def _ensure_loaded(self) -> None:
+        """Load overrides from local storage on first use, then keep up with the store."""
+        if self._loaded:
+            if self._store is not None:
+                # Lets the store pick up overrides saved by other processes
+                self._store.refresh()
+            if self._store_changes and self._batch_depth == 0:
+                self._sync_from_store()
+            return
+        
+        with self._lock:
+            if self._loaded:
+                return
+            if self._persist:
+                self._store = get_shared_override_store()
+                self._store.subscribe(self._on_store_change)
+            # Nothing was read before loading, so loading is not itself a change
+            changed_ids = self._changed_ids
+            self._load_from_local_storage()
+            self._changed_ids = changed_ids
+            self._loaded = True
     
     def _load_from_local_storage(self) -> None:
-        """Load student overrides from local storage."""
-        self._overrides = self._local_storage.load_student_overrides()
+        """Load student overrides from the shared override store."""
+        if self._store is None:
+            self._set_overrides(None)
+            return
+        self._adopt_snapshot()
     
-    def _save_to_local_storage(self) -> None:
-        """Save current overrides to local storage."""
-        self._local_storage.save_student_overrides(self._overrides)
+    def _on_store_change(self, version: int, changed_ids: Optional[Set[str]]) -> None:
+        # Called by the store while it holds its lock, so only record the change here
+        with self._store_changes_lock:
+            self._store_changes.append((version, changed_ids))
     
-    def import_overrides(self, csv_path: str) -> None:
-        """Import student overrides from CSV file.
+    def _sync_from_store(self) -> None:
+        """Apply changes saved by other managers, saving any pending edits first."""
+        with self._lock:
+            if self._batch_depth > 0 or not self._store_changes:
+                return
+            if self._pending_all or self._pending_ids:
+                # Flushing publishes these edits and adopts the result
+                self.flush()
+            else:
+                self._adopt_snapshot()
+    
+    def _adopt_snapshot(self, own_version: Optional[int] = None) -> None:
+        """Share the store's current overrides, marking changes made by others.
         
-        Expected columns: Student ID, Smart Score Threshold, Minimum Grade
+        own_version is the store version produced by this manager's own save, whose
+        changes were already marked when they were made.
         """
-        try:
-            df = pd.read_csv(csv_path)
+        version, self._overrides, self._index = self._store.snapshot()
+        self._shared = True
+        self._version += 1
+        
+        with self._store_changes_lock:
+            changes = [c for c in self._store_changes if c[0] <= version]
+            self._store_changes = [c for c in self._store_changes if c[0] > version]
+        for change_version, changed_ids in changes:
+            if change_version == own_version:
+                continue
+            if changed_ids is None:
+                self._changed_ids = None
+            else:
+                self._mark_changed(changed_ids)
+    
+    def _make_private(self) -> None:
+        """Copy overrides shared with the store before they are edited in place."""
+        if not self._shared:
+            return
+        if self._overrides is not None:
+            self._overrides = self._overrides.copy()
+        self._index = dict(self._index)
+        self._shared = False
+    
+    def _set_overrides(self, df: Optional[pd.DataFrame]) -> None:
+        """Replace all overrides and rebuild the Student ID index."""
+        if df is not None:
+            # Only the first override for a student was ever used for lookups
+            df = df.drop_duplicates(subset=["Student ID"], keep="first")
+            self._index = dict(zip(df["Student ID"], df.index))
+        else:
+            self._index = {}
+        self._overrides = df
+        self._shared = False
+        self._changed_ids = None
+        self._version += 1
+    
+    def _mark_changed(self, student_ids: Iterable[str]) -> None:
+        if self._changed_ids is not None:
+            self._changed_ids.update(student_ids)
+        self._version += 1
+    
+    def get_fingerprint(self) -> str:
+        """Get a hash of the current overrides, equal for equal override contents.
+        
+        Unlike a version counter, fingerprints can be compared across instances.
+        """
+        self._ensure_loaded()
+        with self._lock:
+            if self._fingerprint is not None and self._fingerprint[0] == self._version:
+                return self._fingerprint[1]
             
-            # Validate required columns
-            required_columns = ["Student ID", "Smart Score Threshold", "Minimum Grade"]
-            missing_columns = [col for col in required_columns if col not in df.columns]
-            if missing_columns:
-                raise ValueError(f"Missing required columns: {missing_columns}")
+            digest = hashlib.blake2b(digest_size=16)
+            if self.has_overrides():
+                columns = ["Student ID", "Smart Score Threshold", "Minimum Grade"]
+                overrides = self._overrides[columns].astype(
+                    {"Smart Score Threshold": float, "Minimum Grade": float}
+                )
+                digest.update(
+                    pd.util.hash_pandas_object(overrides, index=False).to_numpy().tobytes()
+                )
             
-            # Clean and validate data
-            df = self._clean_overrides_data(df)
-            self._overrides = df
+            self._fingerprint = (self._version, digest.hexdigest())
+            return self._fingerprint[1]
+    
+    def pop_changes(self) -> Optional[Set[str]]:
+        """Get the cleaned Student IDs changed since the last call and reset tracking.
+        
+        Returns None when the overrides were replaced wholesale (loaded, imported or
+        cleared), meaning any student may have changed.
+        """
+        self._ensure_loaded()
+        # The flush timer marks changes picked up from the store on its own thread
+        with self._lock:
+            changed_ids = self._changed_ids
+            self._changed_ids = set()
+        return changed_ids
+    
+    def restore_changes(self, changed_ids: Optional[Set[str]]) -> None:
+        """Put changes taken by pop_changes back, such as when grading them failed."""
+        with self._lock:
+            if changed_ids is None:
+                self._changed_ids = None
+            elif self._changed_ids is not None:
+                self._changed_ids.update(changed_ids)
+    
+    def _save_to_local_storage(self, student_ids: Optional[Iterable[str]] = None) -> None:
+        """Save the given students' overrides, or all overrides if None, to local storage."""
+        self._mark_unsaved(student_ids)
+        if self._batch_depth == 0:
+            self.flush()
+    
+    def _queue_save(self, student_ids: Iterable[str]) -> None:
+        """Queue the given students' overrides to be saved after the flush delay."""
+        self._mark_unsaved(student_ids)
+        if self._store is None:
+            return
+        
+        with self._lock:
+            if self._batch_depth > 0:
+                return
+            # Restart the debounce so a burst of edits is saved once
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(self._flush_delay, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
+    def _mark_unsaved(self, student_ids: Optional[Iterable[str]]) -> None:
+        if self._store is None:
+            return
+        
+        with self._lock:
+            if student_ids is None:
+                self._pending_all = True
+                self._pending_ids.clear()
+            elif not self._pending_all:
+                self._pending_ids.update(student_ids)
+            _unflushed.add(self)
+    
+    def flush(self) -> None:
+        """Save any pending override edits through the shared override store now.
+        
+        Afterwards this manager shares the store's overrides again, including any
+        changes other managers saved in the meantime.
+        """
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._store is None or not (self._pending_all or self._pending_ids):
+                return
             
-            # Save to local storage for persistence
-            self._save_to_local_storage()
+            with self._stats.stage("save_overrides") as stage:
+                if self._pending_all:
+                    version = self._store.replace(self._overrides)
+                    stage.set_rows(len(self._index))
+                else:
+                    labels = [self._index[i] for i in self._pending_ids if i in self._index]
+                    deleted_ids = [i for i in self._pending_ids if i not in self._index]
+                    upserts = self._overrides.loc[labels] if labels else None
+                    version = self._store.update(upserts, deleted_ids)
+                    stage.set_rows(len(self._pending_ids))
+            
+            self._pending_all = False
+            self._pending_ids = set()
+            _unflushed.discard(self)
+            self._adopt_snapshot(own_version=version)
+    
+    @contextmanager
+    def batch(self) -> Iterator["StudentOverrides"]:
+        """Defer saving override edits until the block exits, then save them together."""
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self.flush()
+    
+    def import_overrides(self, source: str | PathLike | bytes | BinaryIO | TextIO) -> None:
+        """Import student overrides from a CSV file path, raw bytes or buffer.
+        
+        Expected columns: Student ID, Smart Score Threshold, Minimum Grade
+        
+        Imported rows are merged into the current overrides as by set_overrides_bulk;
+        students not in the file keep their overrides.
+        """
+        try:
+            with self._stats.stage("import_overrides") as stage:
+                df = read_csv(
+                    io.BytesIO(source) if isinstance(source, bytes) else source,
+                    text_columns=["Student ID"],
+                )
+                
+                # Validate required columns
+                required_columns = ["Student ID", "Smart Score Threshold", "Minimum Grade"]
+                missing_columns = [col for col in required_columns if col not in df.columns]
+                if missing_columns:
+                    raise ValueError(f"Missing required columns: {missing_columns}")
+                
+                self.set_overrides_bulk(df)
+                stage.set_rows(len(df))
             
         except Exception as e:
             raise ValueError(f"Error importing student overrides: {str(e)}")
     
+    def set_overrides_bulk(self, overrides: pd.DataFrame | Iterable[dict]) -> None:
+        """Set overrides for many students at once.
+        
+        Accepts a DataFrame or records with a Student ID and either or both of Smart Score
+        Threshold and Minimum Grade. As with set_override, a missing value leaves that
+        student's existing value unchanged. Out-of-range values are treated as missing,
+        and if a Student ID appears more than once, its first row is used.
+        """
+        self._ensure_loaded()
+        if isinstance(overrides, pd.DataFrame):
+            df = overrides.copy()
+        else:
+            df = pd.DataFrame.from_records(list(overrides))
+        
+        if len(df) == 0:
+            return
+        
+        columns = ["Student ID", "Smart Score Threshold", "Minimum Grade"]
+        if "Student ID" not in df.columns:
+            raise ValueError("Missing required columns: ['Student ID']")
+        df = df.reindex(columns=columns)
+        
+        # Clean and validate all rows in one pass
+        df = self._clean_overrides_data(df)
+        df = df.drop_duplicates(subset=["Student ID"], keep="first")
+        
+        with self._lock:
+            self._merge_overrides(df)
+            
+            # Save to local storage for persistence
+            self._save_to_local_storage(df["Student ID"])
+    
+    def _merge_overrides(self, df: pd.DataFrame) -> None:
+        """Upsert cleaned, de-duplicated override rows into the current overrides."""
+        self._make_private()
+        value_columns = ["Smart Score Threshold", "Minimum Grade"]
+        labels = df["Student ID"].map(self._index)
+        existing = labels.notna().to_numpy()
+        
+        # Update students that already have overrides, keeping values the batch leaves unset
+        if existing.any():
+            updates = df[existing]
+            update_labels = labels[existing].astype(int).to_numpy()
+            for column in value_columns:
+                provided = updates[column].notna().to_numpy()
+                self._overrides.loc[update_labels[provided], column] = (
+                    updates[column].to_numpy()[provided]
+                )
+        
+        # Append new students under consecutive free row labels
+        additions = df[~existing]
+        if len(additions) > 0:
+            has_rows = self._overrides is not None and len(self._overrides) > 0
+            start = int(self._overrides.index[-1]) + 1 if has_rows else 0
+            additions = additions.set_axis(pd.RangeIndex(start, start + len(additions)))
+            self._overrides = (
+                pd.concat([self._overrides, additions]) if has_rows else additions
+            )
+            self._index.update(zip(additions["Student ID"], additions.index))
+        
+        self._mark_changed(df["Student ID"])
+    
+    def remove_overrides_bulk(self, student_ids: Iterable[str]) -> None:
+        """Remove overrides for many students at once."""
+        self._ensure_loaded()
+        if self._overrides is None:
+            return
+        
+        student_ids = _normalize_ids(pd.Series(list(student_ids), dtype=object)).unique()
+        with self._lock:
+            removed_ids = [i for i in student_ids if i in self._index]
+            if not removed_ids:
+                return
+            self._make_private()
+            labels = [self._index.pop(i) for i in removed_ids]
+            
+            self._overrides = self._overrides.drop(index=labels)
+            self._mark_changed(removed_ids)
+            
+            # Save to local storage for persistence
+            self._save_to_local_storage(removed_ids)
+    
     def _clean_overrides_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean and validate override data."""
-        # Clean student IDs (similar to report cleaning)
-        df["Student ID"] = (
-            df["Student ID"].astype(str).str.lstrip("ID").astype(str).str.strip()
-        )
+        # Clean student IDs the same way as report Student IDs
+        df["Student ID"] = _normalize_ids(df["Student ID"])
         
         # Convert numeric columns and handle missing values
         df["Smart Score Threshold"] = pd.to_numeric(df["Smart Score Threshold"], errors="coerce")
@@ -70,32 +411,39 @@ class StudentOverrides:
     def set_override(self, student_id: str, smart_score_threshold: Optional[float] = None, 
                     minimum_grade: Optional[float] = None) -> None:
         """Set override for a specific student."""
-        if self._overrides is None:
-            self._overrides = pd.DataFrame(columns=["Student ID", "Smart Score Threshold", "Minimum Grade"])
-        
+        self._ensure_loaded()
         # Clean student ID
-        student_id = str(student_id).lstrip("ID").strip()
-        
-        # Check if student already has overrides
-        existing_idx = self._overrides[self._overrides["Student ID"] == student_id].index
+        student_id = _normalize_id(student_id)
         
-        if len(existing_idx) > 0:
-            # Update existing override
-            if smart_score_threshold is not None:
-                self._overrides.loc[existing_idx, "Smart Score Threshold"] = smart_score_threshold
-            if minimum_grade is not None:
-                self._overrides.loc[existing_idx, "Minimum Grade"] = minimum_grade
-        else:
-            # Add new override
-            new_override = pd.DataFrame({
-                "Student ID": [student_id],
-                "Smart Score Threshold": [smart_score_threshold],
-                "Minimum Grade": [minimum_grade]
-            })
-            self._overrides = pd.concat([self._overrides, new_override], ignore_index=True)
-        
-        # Save to local storage for persistence
-        self._save_to_local_storage()
+        with self._lock:
+            self._make_private()
+            if self._overrides is None:
+                self._overrides = pd.DataFrame(columns=["Student ID", "Smart Score Threshold", "Minimum Grade"])
+            
+            # Check if student already has overrides
+            existing_label = self._index.get(student_id)
+            
+            if existing_label is not None:
+                # Update existing override
+                if smart_score_threshold is not None:
+                    self._overrides.at[existing_label, "Smart Score Threshold"] = smart_score_threshold
+                if minimum_grade is not None:
+                    self._overrides.at[existing_label, "Minimum Grade"] = minimum_grade
+            else:
+                # Add new override under the next free row label
+                new_label = int(self._overrides.index[-1]) + 1 if len(self._overrides) > 0 else 0
+                new_override = pd.DataFrame({
+                    "Student ID": [student_id],
+                    "Smart Score Threshold": [smart_score_threshold],
+                    "Minimum Grade": [minimum_grade]
+                }, index=[new_label])
+                self._overrides = pd.concat([self._overrides, new_override])
+                self._index[student_id] = new_label
+            
+            self._mark_changed([student_id])
+            
+            # Save to local storage for persistence
+            self._queue_save([student_id])
     
     def get_override(self, student_id: str) -> Tuple[Optional[float], Optional[float]]:
         """Get smart score threshold and minimum grade for a student.
@@ -103,45 +451,142 @@ class StudentOverrides:
         Returns:
             Tuple of (smart_score_threshold, minimum_grade), with None if not set
         """
-        if self._overrides is None:
-            return None, None
+        self._ensure_loaded()
+        # The index and frame are swapped together by flushes on the timer thread, and
+        # their row labels only match each other
+        with self._lock:
+            if self._overrides is None:
+                return None, None
+            
+            # Clean student ID for lookup
+            label = self._index.get(_normalize_id(student_id))
+            if label is None:
+                return None, None
+            
+            smart_score_threshold = self._overrides.at[label, "Smart Score Threshold"]
+            minimum_grade = self._overrides.at[label, "Minimum Grade"]
+        smart_score_threshold = smart_score_threshold if pd.notna(smart_score_threshold) else None
+        minimum_grade = minimum_grade if pd.notna(minimum_grade) else None
         
-        # Clean student ID for lookup
-        student_id = str(student_id).lstrip("ID").strip()
+        return smart_score_threshold, minimum_grade
+    
+    def get_overrides(
+        self, student_ids: Iterable[str], normalized: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Get smart score thresholds and minimum grades for many students at once.
         
-        student_row = self._overrides[self._overrides["Student ID"] == student_id]
-        if len(student_row) == 0:
-            return None, None
+        Pass normalized=True for Student IDs that are already cleaned, such as a
+        Report's Student ID column, to skip cleaning them again.
         
-        row = student_row.iloc[0]
-        smart_score_threshold = row["Smart Score Threshold"] if pd.notna(row["Smart Score Threshold"]) else None
-        minimum_grade = row["Minimum Grade"] if pd.notna(row["Minimum Grade"]) else None
+        Returns:
+            Tuple of (smart_score_thresholds, minimum_grades) float arrays aligned with
+            student_ids, with NaN where no override is set
+        """
+        self._ensure_loaded()
+        # Held so the index and frame read below come from the same snapshot
+        with self._lock, self._stats.stage("lookup_overrides") as stage:
+            if normalized:
+                labels = pd.Series(student_ids, copy=False).map(self._index)
+            else:
+                labels = _normalize_ids(pd.Series(student_ids, dtype=object)).map(self._index)
+            found = labels.notna().to_numpy()
+            stage.set_rows(len(labels))
+            
+            smart_score_thresholds = np.full(len(labels), np.nan)
+            minimum_grades = np.full(len(labels), np.nan)
+            if not found.any():
+                return smart_score_thresholds, minimum_grades
+            
+            rows = self._overrides.loc[labels[found].astype(int)]
+            smart_score_thresholds[found] = pd.to_numeric(
+                rows["Smart Score Threshold"], errors="coerce"
+            ).to_numpy(dtype=float, na_value=np.nan)
+            minimum_grades[found] = pd.to_numeric(
+                rows["Minimum Grade"], errors="coerce"
+            ).to_numpy(dtype=float, na_value=np.nan)
         
-        return smart_score_threshold, minimum_grade
+        return smart_score_thresholds, minimum_grades
     
     def remove_override(self, student_id: str) -> None:
         """Remove override for a specific student."""
+        self._ensure_loaded()
         if self._overrides is None:
             return
         
-        student_id = str(student_id).lstrip("ID").strip()
-        self._overrides = self._overrides[self._overrides["Student ID"] != student_id]
-        
-        # Save to local storage for persistence
-        self._save_to_local_storage()
+        student_id = _normalize_id(student_id)
+        with self._lock:
+            if student_id not in self._index:
+                return
+            self._make_private()
+            label = self._index.pop(student_id)
+            self._overrides = self._overrides.drop(index=label)
+            self._mark_changed([student_id])
+
+            # Save to local storage for persistence
+            self._queue_save([student_id])
     
     def get_all_overrides(self) -> pd.DataFrame:
         """Get all student overrides as a DataFrame."""
-        if self._overrides is None:
-            return pd.DataFrame(columns=["Student ID", "Smart Score Threshold", "Minimum Grade"])
-        return self._overrides.copy()
+        self._ensure_loaded()
+        with self._lock:
+            if self._overrides is None:
+                return pd.DataFrame(
+                    columns=["Student ID", "Smart Score Threshold", "Minimum Grade"]
+                )
+            return self._overrides.copy()
+    
+    def get_page(
+        self,
+        page: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        sort_by: Optional[str] = None,
+        ascending: bool = True,
+        search: Optional[str] = None,
+    ) -> Tuple[pd.DataFrame, int]:
+        """Get one zero-based page of overrides and the number matching search.
+        
+        search finds a Student ID exactly through the Student ID index, or else any
+        Student ID containing it. Pages are cached until the overrides change.
+        """
+        self._ensure_loaded()
+        with self._lock:
+            if not self.has_overrides():
+                return self.get_all_overrides(), 0
+            return self._pages.get_page(
+                self._overrides,
+                self._version,
+                page,
+                page_size,
+                None,
+                sort_by,
+                ascending,
+                search,
+                ["Student ID"],
+                self._find_override_position,
+            )
+    
+    def _find_override_position(self, search: str) -> Optional[np.ndarray]:
+        label = self._index.get(_normalize_id(search))
+        if label is None:
+            return None
+        return np.array([self._overrides.index.get_loc(label)])
+    
+    def stats(self) -> Dict[str, StageStats]:
+        """Get the latest stats of each import, lookup and save stage, by stage name.
+        
+        Stages are only recorded while diagnostics are enabled.
+        """
+        return self._stats.stats()
     
     def has_overrides(self) -> bool:
         """Check if any overrides are loaded."""
-        return self._overrides is not None and len(self._overrides) > 0
+        self._ensure_loaded()
+        overrides = self._overrides
+        return overrides is not None and len(overrides) > 0
     
     def export_overrides(self, output_path: str) -> None:
         """Export current overrides to CSV file."""
+        self._ensure_loaded()
         if self._overrides is None or len(self._overrides) == 0:
             raise ValueError("No overrides to export")
         
@@ -149,5 +594,22 @@ class StudentOverrides:
     
     def clear_all_overrides(self) -> None:
         """Clear all student overrides from both memory and local storage."""
-        self._overrides = None
-        self._local_storage.clear_student_overrides()
\ No newline at end of file
+        self._ensure_loaded()
+        with self._lock:
+            self._set_overrides(None)
+            self._save_to_local_storage()
+
+
+@atexit.register
+def _flush_all() -> None:
+    for overrides in list(_unflushed):
+        overrides.flush()
+
+
+def _normalize_id(student_id: str) -> str:
+    # Some Student IDs are formatted as "ID0123456789" instead of "0123456789"
+    return str(student_id).lstrip("ID").strip()
+
+
+def _normalize_ids(student_ids: pd.Series) -> pd.Series:
+    return student_ids.astype(str).str.lstrip("ID").str.strip()
@@ -1,18 +1,13 @@
 import streamlit as st
 
-from ixl_grader.ui.components import (
-    render_file_uploader,
-    render_file_viewer,
-    render_grade_button,
-    render_grading_params,
-    render_results_summary,
-    render_footer,
-)
+from ixl_grader.ui import components
 from ixl_grader.ui.session import initialize_session_state
 from ixl_grader.ui.session.file_upload import is_uploaded
-from ixl_grader.ui.session.grade import is_graded
+from ixl_grader.ui.session.grade import is_graded, refresh_grades
+from ixl_grader.ui.session.updater import track_render
 
 
+@track_render
 def render():
     """Render the main application"""
 
@@ -25,20 +20,25 @@ def render():
     initialize_session_state()
 
     # File upload section
-    render_file_uploader()
+    components.render_file_uploader()
 
     # Show file details and preview if file is uploaded
     if is_uploaded():
-        render_file_viewer()
+        components.render_file_viewer()
 
     # Grading parameters section
-    render_grading_params()
+    components.render_grading_params()
 
     if is_uploaded():
         # Grading button
-        render_grade_button()
+        components.render_grade_button()
 
         if is_graded():
-            render_results_summary()
+            # Pick up overrides saved from other sessions, regrading only their students
+            refresh_grades()
+            components.render_results_summary()
 
-    render_footer()
+        # Stage timings, recorded only once turned on
+        components.render_diagnostics()
+
+    components.render_footer()
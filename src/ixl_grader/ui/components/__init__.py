@@ -1,16 +1,23 @@
-from .file_uploader import render_file_uploader
-from .file_viewer import render_file_viewer
-from .grade_button import render_grade_button
-from .grading_params import render_grading_params
-from .results_summary import render_results_summary
-from .footer import render_footer
+import importlib
 
 
-__all__ = [
-    "render_file_uploader",
-    "render_file_viewer",
-    "render_grade_button",
-    "render_grading_params",
-    "render_results_summary",
-    "render_footer",
-]
+# Components are imported on first use, so a rerun only loads what it renders
+_COMPONENT_MODULES = {
+    "render_file_uploader": "file_uploader",
+    "render_file_viewer": "file_viewer",
+    "render_grade_button": "grade_button",
+    "render_grading_params": "grading_params",
+    "render_results_summary": "results_summary",
+    "render_diagnostics": "diagnostics",
+    "render_footer": "footer",
+}
+
+
+__all__ = list(_COMPONENT_MODULES)
+
+
+def __getattr__(name):
+    module_name = _COMPONENT_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{module_name}", __name__), name)
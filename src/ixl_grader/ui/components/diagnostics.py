@@ -0,0 +1,62 @@
+import streamlit as st
+
+from ixl_grader.core import diagnostics
+from ixl_grader.ui.session.report import get_report
+
+
+def render_diagnostics():
+    """Render stage timings and memory use of the current report, when turned on"""
+
+    with st.expander("🩺 Diagnostics", expanded=False):
+        col_enabled, col_memory = st.columns(2)
+        with col_enabled:
+            st.toggle(
+                "Record stage timings",
+                value=diagnostics.is_enabled(),
+                key="diagnostics_enabled",
+                on_change=_update_diagnostics,
+            )
+        with col_memory:
+            st.toggle(
+                "Track peak memory (slower)",
+                value=diagnostics.is_tracking_memory(),
+                key="diagnostics_memory",
+                on_change=_update_diagnostics,
+                disabled=not diagnostics.is_enabled(),
+            )
+
+        report = get_report()
+        stats = report.stats() if report is not None else {}
+        if not stats:
+            st.caption(
+                "Turn on recording, then upload or grade again to see how long each stage takes."
+            )
+            return
+
+        st.dataframe(
+            [
+                {
+                    "Stage": stage.stage,
+                    "Source": stage.source.replace("_", " "),
+                    "Seconds": round(stage.seconds, 4),
+                    "Rows": stage.rows,
+                    "Rows repaired": stage.rows_repaired,
+                    "Rows/s": round(stage.rows / stage.seconds) if stage.seconds else None,
+                    "Peak MB": (
+                        None if stage.peak_bytes is None else round(stage.peak_bytes / 1e6, 1)
+                    ),
+                }
+                for stage in stats.values()
+            ],
+            use_container_width=True,
+            hide_index=True,
+        )
+        st.caption("Latest run of each stage. Recording applies to every session of the app.")
+
+
+def _update_diagnostics():
+    """Apply the diagnostics toggles to the whole process"""
+    diagnostics.set_enabled(
+        st.session_state.diagnostics_enabled,
+        track_memory=st.session_state.get("diagnostics_memory", False),
+    )
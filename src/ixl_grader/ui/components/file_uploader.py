@@ -1,6 +1,6 @@
 import streamlit as st
 
-from ixl_grader.ui.session.file_upload import get_uploaded_file, handle_file_upload
+from ixl_grader.ui.session.file_upload import get_upload_error, handle_file_uploader_change
 
 
 def render_file_uploader():
@@ -8,12 +8,15 @@ def render_file_uploader():
     st.header("📁 Upload File")
     st.markdown("Upload your IXL assignments CSV file to begin grading.")
     
-    uploaded_file = st.file_uploader(
+    # New files are handled in the change callback, before the page is drawn
+    st.file_uploader(
         "Choose your IXL assignments CSV file",
         type=["csv"],
         help="Upload the CSV file exported from IXL containing student assignments",
+        key="report_uploader",
+        on_change=handle_file_uploader_change,
     )
 
-    prev_uploaded_file = get_uploaded_file()
-    if uploaded_file is not None and uploaded_file != prev_uploaded_file:
-        handle_file_upload(uploaded_file=uploaded_file)
+    upload_error = get_upload_error()
+    if upload_error is not None:
+        st.error(upload_error)
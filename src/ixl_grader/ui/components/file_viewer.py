@@ -1,5 +1,6 @@
 import streamlit as st
 
+from ixl_grader.ui.components.paged_table import render_paged_table
 from ixl_grader.ui.session.report import get_report
 
 
@@ -13,11 +14,20 @@ def render_file_viewer():
     if report is None:
         st.error("Error: No report found in session state.")
 
-    # Preview the data
-    df_preview = report.get_df()
+    # Preview the data through a read-only view rather than a full copy
+    report_view = report.view()
 
     st.subheader("📋 Data Preview")
-    st.dataframe(df_preview.head(), use_container_width=True)
+    # Only the visible page is sliced from the report and sent to the browser
+    render_paged_table("report_preview", report.get_page, list(report_view.columns))
     st.info(
-        f"Dataset contains {len(df_preview)} rows and {len(df_preview.columns)} columns"
+        f"Dataset contains {len(report_view)} rows and {len(report_view.columns)} columns"
     )
+
+    rows_repaired = report.get_rows_repaired()
+    if rows_repaired > 0:
+        st.caption(f"🔧 Repaired {rows_repaired} row(s) with extra columns from commas in names")
+
+    memory_saved = report.get_memory_saved()
+    if memory_saved > 0:
+        st.caption(f"💾 Compact column types saved {memory_saved / 1024 / 1024:.1f} MB")
@@ -2,12 +2,20 @@ import streamlit as st
 
 from ixl_grader.ui.session.file_upload import is_uploaded
 from ixl_grader.ui.session.grade import (
-    get_smart_score_threshold,
+    cancel_grading,
+    finish_grading,
+    get_grading_error,
+    get_grading_job,
+    grade_report,
     is_gradable,
     is_graded,
-    set_is_graded,
 )
-from ixl_grader.ui.session.report import get_report
+
+# Seconds between progress updates while a report is graded in the background
+GRADING_POLL_SECONDS = 0.5
+
+# Graded rows shown while a background grade runs
+PARTIAL_RESULTS_ROWS = 10
 
 
 def render_grade_button() -> None:
@@ -16,25 +24,57 @@ def render_grade_button() -> None:
     
     button_placeholder = st.empty()
 
-    if is_uploaded() and is_gradable() and not is_graded():
+    # A background grade may have finished since the last run
+    finish_grading()
+
+    if get_grading_job() is not None:
         with button_placeholder.container():
-            should_grade = st.button(
+            render_grading_progress()
+
+    elif is_uploaded() and is_gradable() and not is_graded():
+        with button_placeholder.container():
+            # Grading runs in the click callback, so the results show in the same run
+            st.button(
                 "🚀 Grade Assignments",
                 type="primary",
                 use_container_width=True,
                 key="grade_button",
+                on_click=grade_report,
             )
 
-            if should_grade:
-                report = get_report()
-                smart_score_threshold = get_smart_score_threshold()
-
-                report.grade(smart_score_threshold=smart_score_threshold)
-
-                set_is_graded(True)
+            grading_error = get_grading_error()
+            if grading_error:
+                st.error(grading_error)
 
     elif is_uploaded() and is_graded():
         with button_placeholder.container():
             st.info(
                 "✅ Assignments have been graded! Upload a new file to grade more assignments."
             )
+
+
+@st.fragment(run_every=GRADING_POLL_SECONDS)
+def render_grading_progress():
+    """Show progress and the first graded rows of a background grade.
+
+    Only this fragment reruns while grading, and the whole page reruns once to show
+    the results when the job is done.
+    """
+    job = get_grading_job()
+    if job is None or job.is_done():
+        st.rerun()
+
+    rows_total = job.get_rows_total()
+    st.progress(
+        job.get_progress(),
+        text=f"Grading… {job.get_rows_graded():,} of {rows_total:,} rows"
+        if rows_total
+        else "Preparing to grade…",
+    )
+
+    partial_results = job.get_partial_results(PARTIAL_RESULTS_ROWS)
+    if len(partial_results) > 0:
+        st.caption("First graded rows")
+        st.dataframe(partial_results, use_container_width=True, hide_index=True)
+
+    st.button("Cancel", key="cancel_grading_button", on_click=cancel_grading)
@@ -2,8 +2,10 @@ import streamlit as st
 
 from ixl_grader.ui.session.grade import (
     get_smart_score_threshold,
-    set_smart_score_threshold,
+    handle_threshold_slider_change,
+    is_gradable,
 )
+from ixl_grader.ui.session.report import get_report
 from ixl_grader.ui.components.student_overrides import render_student_overrides_section
 
 
@@ -20,18 +22,38 @@ def render_grading_params():
     # Global threshold settings
     subcol1, subcol2 = st.columns([1, 1])
     with subcol1:
-        threshold = st.slider(
+        # The threshold is updated and grades refreshed in the change callback
+        st.slider(
             "SmartScore Threshold (%)",
             min_value=0,
             max_value=100,
             value=smart_score_threshold,
             help="Students with SmartScore above this threshold will receive full points",
+            key="smart_score_threshold_slider",
+            on_change=handle_threshold_slider_change,
         )
 
-        if threshold != smart_score_threshold:
-            set_smart_score_threshold(threshold)
-
     with subcol2:
-        st.metric("SmartScore Threshold", f"{threshold}%")
+        st.metric("SmartScore Threshold", f"{smart_score_threshold}%")
+
+    render_threshold_sweep_chart()
 
     render_student_overrides_section()
+
+
+def render_threshold_sweep_chart():
+    """Render how the class average grade changes with the SmartScore threshold"""
+
+    report = get_report()
+    if report is None or not is_gradable():
+        return
+
+    from ixl_grader.core.report import PASSING_SCORE
+
+    summary = report.grade_sweep_summary(thresholds=range(1, 101))
+
+    st.markdown("**Threshold vs. Average Grade**")
+    st.line_chart(summary, y=["Average Score", "Pass Rate"])
+    st.caption(
+        f"Average score and pass rate (≥{PASSING_SCORE}%) for every threshold, including student overrides"
+    )
@@ -0,0 +1,63 @@
+import streamlit as st
+
+
+@st.fragment
+def render_paged_table(key: str, get_page, sort_columns: list[str], page_size: int = 20):
+    """Render one page of a large table with search, sort and page controls.
+
+    get_page is a Report or StudentOverrides get_page method, which searches, sorts
+    and slices server-side, so only the visible rows are sent to the browser. Paging
+    reruns only this fragment.
+    """
+
+    page_key = f"{key}_page"
+
+    col_search, col_sort, col_order = st.columns([2, 2, 1], vertical_alignment="bottom")
+    with col_search:
+        search = st.text_input(
+            "Search",
+            placeholder="Student ID or name",
+            key=f"{key}_search",
+            on_change=_reset_page,
+            args=(page_key,),
+        )
+    with col_sort:
+        sort_by = st.selectbox(
+            "Sort by",
+            [None, *sort_columns],
+            format_func=lambda column: "Original order" if column is None else column,
+            key=f"{key}_sort",
+            on_change=_reset_page,
+            args=(page_key,),
+        )
+    with col_order:
+        descending = st.toggle("Descending", key=f"{key}_descending")
+
+    page = st.session_state.get(page_key, 1)
+    rows, total = get_page(
+        page=page - 1,
+        page_size=page_size,
+        sort_by=sort_by,
+        ascending=not descending,
+        search=search,
+    )
+
+    st.dataframe(rows, use_container_width=True, hide_index=True)
+
+    # The page widget is drawn after the table so its range can follow the match count
+    pages = max(-(-total // page_size), 1)
+    st.session_state[page_key] = min(page, pages)
+    col_page, col_count = st.columns([1, 3], vertical_alignment="center")
+    with col_page:
+        page = st.number_input(
+            "Page", min_value=1, max_value=pages, step=1, key=page_key
+        )
+    with col_count:
+        first_row = (page - 1) * page_size + 1 if total else 0
+        last_row = min(page * page_size, total)
+        st.caption(f"Rows {first_row}–{last_row} of {total} · page {page} of {pages}")
+
+
+def _reset_page(page_key: str):
+    """Go back to the first page after the search or sort changes"""
+    st.session_state[page_key] = 1
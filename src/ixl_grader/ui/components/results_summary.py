@@ -1,10 +1,10 @@
-import io
 import os
 
 import streamlit as st
 
+from ixl_grader.core.report import PASSING_SCORE
 from ixl_grader.ui.session.file_upload import get_uploaded_file
-from ixl_grader.ui.session.report import get_report
+from ixl_grader.ui.session.report import get_report, prepare_report_download
 
 
 def render_results_summary():
@@ -14,53 +14,60 @@ def render_results_summary():
     st.markdown("View grading statistics and download the graded results.")
 
     report = get_report()
-    graded_df = report.get_df()
+
+    # Summary metrics are kept up to date by the report as it regrades
+    summary = report.get_score_summary()
 
     # Show summary statistics
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        st.metric("Total Students", len(graded_df))
+        st.metric("Total Students", summary["Total Students"])
 
     with col2:
-        graded_students = graded_df["Score"].notna().sum()
-        st.metric("Graded Students", graded_students)
+        st.metric("Graded Students", summary["Graded Students"])
 
     with col3:
-        if graded_students > 0:
-            avg_score = graded_df["Score"].mean()
-            st.metric("Average Score", f"{avg_score:.1f}%")
+        if summary["Average Score"] is not None:
+            st.metric("Average Score", f"{summary['Average Score']:.1f}%")
         else:
             st.metric("Average Score", "N/A")
 
     with col4:
-        if graded_students > 0:
-            passing_students = (graded_df["Score"] >= 70).sum()
-            pass_rate = (passing_students / graded_students) * 100
-            st.metric("Pass Rate (≥70%)", f"{pass_rate:.1f}%")
+        if summary["Pass Rate"] is not None:
+            st.metric(f"Pass Rate (≥{PASSING_SCORE}%)", f"{summary['Pass Rate']:.1f}%")
         else:
             st.metric("Pass Rate", "N/A")
 
     # Show graded data preview (top 5, limited columns)
     st.subheader("📊 Graded Results Preview")
     preview_cols = ["Student ID", "Last name", "First name", "SmartScore", "Score"]
-    preview_existing = [c for c in preview_cols if c in graded_df.columns]
-    st.dataframe(graded_df[preview_existing].head(5), use_container_width=True)
-
-    # Prepare CSV for download
-    buffer = io.StringIO()
-    report.export_report(buffer)
+    preview_existing = [c for c in preview_cols if c in report.view().columns]
+    st.dataframe(report.head(5, columns=preview_existing), use_container_width=True)
 
     uploaded_file = get_uploaded_file()
     file_name, extension = os.path.splitext(uploaded_file.name)
     download_file_name = f"{file_name}-Graded{extension}"
 
+    # Building the CSV is the costly part of this section, so it is only done on
+    # request and then reused from the report until the grades change
+    if not report.has_cached_export():
+        st.button(
+            "📦 Prepare Graded Results",
+            key="prepare_download_button",
+            on_click=prepare_report_download,
+            type="primary",
+            use_container_width=True,
+        )
+        return
+
     # Download button
     st.download_button(
         label="📥 Download Graded Results",
-        data=buffer.getvalue(),
+        data=report.export_bytes(),
         file_name=download_file_name,
         mime="text/csv",
+        on_click="ignore",
         type="primary",
         use_container_width=True,
     )
@@ -15,10 +15,12 @@ def render_sample_calculations():
     st.subheader("📊 Processing")
 
     # Add a preview of what the grading will look like
-    df_preview = report.get_df()
+    df_preview = report.view()
     if "SmartScore" in df_preview.columns:
         st.markdown("**Sample Grade Calculations:**")
-        sample_scores = df_preview[["Student ID", "SmartScore"]].dropna(subset=["SmartScore"]).head(3)
+        # Take the first three scored rows without copying the rest of the report
+        scored_rows = df_preview["SmartScore"].notna().to_numpy().nonzero()[0][:3]
+        sample_scores = df_preview.iloc[scored_rows][["Student ID", "SmartScore"]]
         
         for idx, row in sample_scores.iterrows():
             student_id = row["Student ID"]
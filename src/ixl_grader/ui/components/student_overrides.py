@@ -1,12 +1,14 @@
 import streamlit as st
 
+from ixl_grader.ui.components.paged_table import render_paged_table
 from ixl_grader.ui.session.student_overrides import (
-    handle_student_overrides_upload,
-    get_uploaded_overrides_file,
+    handle_overrides_uploader_change,
+    handle_override_form_submit,
     has_student_overrides,
     clear_student_overrides,
+    get_student_overrides,
+    pop_overrides_notice,
 )
-from ixl_grader.ui.session.report import get_report
 
 
 def render_student_overrides_section():
@@ -27,7 +29,7 @@ def render_student_overrides_section():
             "Optional: Upload CSV or add individual overrides for students with special accommodations"
         )
 
-        # Row with Upload button (left) and Help button (right)
+        # Row with Upload button (left) and Clear All button (right)
         col_upl, col_help = st.columns([1, 1])
         with col_upl:
             section = st.container(horizontal_alignment="left")
@@ -37,69 +39,33 @@ def render_student_overrides_section():
         with col_help:
             section = st.container(horizontal_alignment="right", horizontal=True)
             with section:
-                if st.button("❓ Info", key="overrides_help_btn"):
-                    # Toggle the help panel open/closed
-                    st.session_state["overrides_help_open"] = not st.session_state.get(
-                        "overrides_help_open", False
-                    )
-
-                if st.button(
+                st.button(
                     "🗑️ Clear All",
                     help="Clear all persisted student overrides",
                     key="clear_overrides",
-                ):
-                    clear_student_overrides()
-                    st.rerun()
-
-        # Closable help panel (modal-style fallback)
-        if st.session_state.get("overrides_help_open", False):
-            with st.container(border=True):
-                st.subheader("About Student Overrides CSV")
-                st.markdown(
-                    """
-                    Use a CSV to set per-student accommodations. Your file should contain these exact column headers:
-                    
-                    - Student ID: Student identifier (e.g., "12345" or "ID12345")
-                    - Smart Score Threshold: Custom SmartScore threshold for this student (0–100, optional)
-                    - Minimum Grade: Minimum grade for this student (0–100, optional)
-                    
-                    Example:
-                    ```csv
-                    Student ID,Smart Score Threshold,Minimum Grade
-                    12345,70,60
-                    67890,,50
-                    11111,85,
-                    ```
-                    Notes:
-                    - Leave cells empty if no override is needed for that student/field
-                    - Student IDs are automatically cleaned (removes the "ID" prefix)
-                    - 🔄 Persistence: Overrides are saved to local storage and persist across browser sessions on this computer
-                    """
+                    on_click=clear_student_overrides,
                 )
 
+        render_overrides_help()
+
         # Reveal the file uploader only after clicking Upload
         if st.session_state.get("show_overrides_uploader", False):
-            uploaded_overrides_file = st.file_uploader(
+            # New files are imported in the change callback, before the page is drawn
+            st.file_uploader(
                 "Choose student overrides CSV file",
                 type=["csv"],
                 help="CSV file with columns: Student ID, Smart Score Threshold, Minimum Grade",
                 key="overrides_uploader",
+                on_change=handle_overrides_uploader_change,
             )
 
-            prev_uploaded_overrides_file = get_uploaded_overrides_file()
-            if (
-                uploaded_overrides_file is not None
-                and uploaded_overrides_file != prev_uploaded_overrides_file
-            ):
-                handle_student_overrides_upload(uploaded_file=uploaded_overrides_file)
-                # Hide uploader after successful selection to keep UI clean
-                st.session_state["show_overrides_uploader"] = False
-                st.rerun()
-            else:
-                # Option to cancel/close the uploader without selecting a file
-                if st.button("Cancel", key="cancel_overrides_upload"):
-                    st.session_state["show_overrides_uploader"] = False
-                    st.rerun()
+            # Option to cancel/close the uploader without selecting a file
+            st.button("Cancel", key="cancel_overrides_upload", on_click=hide_overrides_uploader)
+
+        notice = pop_overrides_notice()
+        if notice is not None:
+            kind, message = notice
+            getattr(st, kind)(message)
 
         # Individual override editor inside the dropdown
         with st.expander("✏️ Add/Edit Individual Override", expanded=False):
@@ -109,6 +75,48 @@ def render_student_overrides_section():
         render_overrides_status()
 
 
+@st.fragment
+def render_overrides_help():
+    """Render the help toggle and panel; toggling reruns only this fragment"""
+
+    if st.button("❓ Info", key="overrides_help_btn"):
+        # Toggle the help panel open/closed
+        st.session_state["overrides_help_open"] = not st.session_state.get(
+            "overrides_help_open", False
+        )
+
+    # Closable help panel (modal-style fallback)
+    if st.session_state.get("overrides_help_open", False):
+        with st.container(border=True):
+            st.subheader("About Student Overrides CSV")
+            st.markdown(
+                """
+                Use a CSV to set per-student accommodations. Your file should contain these exact column headers:
+                
+                - Student ID: Student identifier (e.g., "12345" or "ID12345")
+                - Smart Score Threshold: Custom SmartScore threshold for this student (0–100, optional)
+                - Minimum Grade: Minimum grade for this student (0–100, optional)
+                
+                Example:
+                ```csv
+                Student ID,Smart Score Threshold,Minimum Grade
+                12345,70,60
+                67890,,50
+                11111,85,
+                ```
+                Notes:
+                - Leave cells empty if no override is needed for that student/field
+                - Student IDs are automatically cleaned (removes the "ID" prefix)
+                - 🔄 Persistence: Overrides are saved to local storage and persist across browser sessions on this computer
+                """
+            )
+
+
+def hide_overrides_uploader():
+    """Close the student overrides file uploader"""
+    st.session_state["show_overrides_uploader"] = False
+
+
 def render_individual_override_form():
     """Render form to add/edit individual student overrides (simplified)"""
 
@@ -116,54 +124,30 @@ def render_individual_override_form():
         col1, col2, col3 = st.columns([1, 1, 1])
 
         with col1:
-            student_id = st.text_input("Student ID", help="Enter the student ID")
+            st.text_input("Student ID", help="Enter the student ID", key="override_student_id")
 
         with col2:
-            custom_threshold = st.number_input(
+            st.number_input(
                 "Custom Smart Score Threshold (%)",
                 min_value=0,
                 max_value=100,
                 value=None,
                 help="Leave empty to use global threshold",
+                key="override_threshold",
             )
 
         with col3:
-            minimum_grade = st.number_input(
+            st.number_input(
                 "Minimum Grade (%)",
                 min_value=0,
                 max_value=100,
                 value=None,
                 help="Leave empty for no minimum grade override",
+                key="override_minimum",
             )
 
-        submitted = st.form_submit_button("Set Override")
-
-        if submitted and student_id:
-            # Create a report instance if none exists (for overrides management)
-            from ixl_grader.core.report import Report
-
-            report = get_report()
-            if report is None:
-                # Create a temporary report just for override management
-                from ixl_grader.ui.session.report import set_report
-
-                report = Report()
-                set_report(report)
-
-            # Convert None values appropriately
-            threshold_val = custom_threshold if custom_threshold != 0 else None
-            minimum_val = minimum_grade if minimum_grade != 0 else None
-
-            report.set_student_override(
-                student_id=student_id,
-                smart_score_threshold=threshold_val,
-                minimum_grade=minimum_val,
-            )
-
-            st.success(f"✅ Override set for student {student_id}")
-            st.rerun()
-        elif submitted:
-            st.error("Please enter a Student ID")
+        # The override is set in the submit callback, before the page is drawn
+        st.form_submit_button("Set Override", on_click=handle_override_form_submit)
 
 
 def render_overrides_status():
@@ -174,23 +158,19 @@ def render_overrides_status():
         with st.container(horizontal=True):
             st.success("✅ Student overrides loaded")
 
-        # Show preview of loaded overrides directly below the status, hidden behind a dropdown
-        # Try to read from the current report; fall back to local storage if needed
-        overrides_df = None
-        report = get_report()
-        if report is not None:
-            overrides_df = report.get_student_overrides().get_all_overrides()
-        else:
-            from ixl_grader.core.persistence import get_local_storage
+        # Show a page of the loaded overrides directly below the status
+        student_overrides = get_student_overrides()
+        _, total = student_overrides.get_page(page_size=1)
 
-            _ls_df = get_local_storage().load_student_overrides()
-            overrides_df = _ls_df if (_ls_df is not None and not _ls_df.empty) else None
-
-        if overrides_df is not None and len(overrides_df) > 0:
+        if total > 0:
             with st.container(horizontal_alignment="right", horizontal=True):
-                st.caption(f"💾 Total overrides: {len(overrides_df)}", width="content")
+                st.caption(f"💾 Total overrides: {total}", width="content")
 
-            st.dataframe(overrides_df, use_container_width=True)
+            render_paged_table(
+                "overrides_preview",
+                student_overrides.get_page,
+                ["Student ID", "Smart Score Threshold", "Minimum Grade"],
+            )
 
     else:
         # Check if we have persistent overrides but no report loaded
@@ -15,4 +15,12 @@ def initialize_session_state():
         st.session_state.is_graded = False
     if "uploaded_overrides_file" not in st.session_state:
         st.session_state.uploaded_overrides_file = None
+    if "upload_error" not in st.session_state:
+        st.session_state.upload_error = None
+    if "overrides_notice" not in st.session_state:
+        st.session_state.overrides_notice = None
+    if "grading_job" not in st.session_state:
+        st.session_state.grading_job = None
+    if "grading_error" not in st.session_state:
+        st.session_state.grading_error = None
     # Note: has_student_overrides removed as overrides are now persistent
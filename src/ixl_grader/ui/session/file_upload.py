@@ -1,28 +1,40 @@
-import tempfile
-
 import streamlit as st
 
-from ixl_grader.core.report import Report
-from ixl_grader.ui.session.updater import session_updater
+from ixl_grader.ui.session.updater import session_callback, session_updater
+
+
+@session_callback
+def handle_file_uploader_change():
+    """Handle a new file chosen in the report file uploader"""
+    uploaded_file = st.session_state.report_uploader
+    if uploaded_file is not None and uploaded_file != get_uploaded_file():
+        handle_file_upload(uploaded_file=uploaded_file)
 
 
 @session_updater
 def handle_file_upload(uploaded_file):
     """Handle file upload and update session state"""
 
-    try:
-        # Save the uploaded file to disk
-        with tempfile.NamedTemporaryFile(delete=True) as tmp_file:
-            tmp_file.write(uploaded_file.getvalue())
-            tmp_file.flush()
+    # The grading core loads pandas, so it is imported on the first upload
+    from ixl_grader.core.cache import get_report_cache
+    from ixl_grader.core.report import Report
+    from ixl_grader.ui.session.grade import cancel_grading
 
-            report = Report()
-            report.import_report(csv_path=tmp_file.name)
-            st.session_state.report = report
-            st.session_state.is_gradable = True
+    # A grade still running belongs to the previous report
+    cancel_grading()
+
+    try:
+        # The upload is repaired and parsed in memory without touching disk; repeat
+        # uploads of the same content come straight from the cache
+        report = Report(cache=get_report_cache())
+        report.import_report(uploaded_file.getvalue())
+        st.session_state.report = report
+        st.session_state.is_gradable = True
+        st.session_state.upload_error = None
 
     except Exception as e:
-        st.error(f"❌ Error uploading file: {str(e)}")
+        # Shown next to the uploader, since this may run in a widget callback
+        st.session_state.upload_error = f"❌ Error uploading file: {str(e)}"
         st.session_state.report = None
 
     # Store the uploaded file in session state
@@ -44,3 +56,8 @@ def is_uploaded() -> bool:
 def get_uploaded_file():
     """Get the uploaded file from session state"""
     return st.session_state.uploaded_file
+
+
+def get_upload_error():
+    """Get the error from the last report upload, if it failed"""
+    return st.session_state.upload_error
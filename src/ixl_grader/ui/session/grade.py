@@ -1,6 +1,9 @@
 import streamlit as st
 
-from ixl_grader.ui.session.updater import session_updater
+from ixl_grader.ui.session.updater import session_callback, session_updater
+
+# Reports with at least this many rows are graded in the background with progress
+BACKGROUND_GRADING_ROWS = 200_000
 
 
 def is_graded() -> bool:
@@ -34,3 +37,83 @@ def get_smart_score_threshold() -> int:
 def set_smart_score_threshold(value: int):
     """Set the SmartScore threshold"""
     st.session_state.smart_score_threshold = value
+    refresh_grades()
+
+
+@session_callback
+def handle_threshold_slider_change():
+    """Apply a SmartScore threshold chosen on the threshold slider"""
+    set_smart_score_threshold(st.session_state.smart_score_threshold_slider)
+
+
+@session_callback
+def grade_report():
+    """Grade the current report at the current SmartScore threshold.
+
+    Large reports are graded in the background; the grade section shows progress
+    until finish_grading finds the job done.
+    """
+    report = st.session_state.report
+    smart_score_threshold = st.session_state.smart_score_threshold
+    st.session_state.grading_error = None
+
+    if report.get_row_count() >= BACKGROUND_GRADING_ROWS:
+        # Clicking again while a grade runs returns the same job
+        st.session_state.grading_job = report.grade_async(smart_score_threshold)
+        return
+
+    report.grade(smart_score_threshold=smart_score_threshold)
+    set_is_graded(True)
+
+
+def get_grading_job():
+    """Get the background grading job started in this session, or None"""
+    return st.session_state.grading_job
+
+
+@session_callback
+def cancel_grading():
+    """Cancel the background grading job, keeping the report ungraded"""
+    job = st.session_state.grading_job
+    if job is not None:
+        job.cancel()
+    st.session_state.grading_job = None
+
+
+def finish_grading() -> bool:
+    """Apply the outcome of a finished background grading job.
+
+    Marks the report graded, or keeps the error to show, and returns True once the
+    job is done. Called while the page is drawn, so it never requests a rerun.
+    """
+    job = st.session_state.grading_job
+    if job is None or not job.is_done():
+        return False
+
+    st.session_state.grading_job = None
+    if job.succeeded():
+        st.session_state.is_graded = True
+    elif job.get_error() is not None:
+        st.session_state.grading_error = f"❌ Error grading report: {job.get_error()}"
+    return True
+
+
+def get_grading_error():
+    """Get the error from the last background grade, if it failed"""
+    return st.session_state.grading_error
+
+
+def refresh_grades():
+    """Regrade an already graded report so results follow setting changes.
+
+    The report only recomputes rows affected since it was last graded.
+    """
+    report = st.session_state.report
+    if not st.session_state.is_graded or report is None:
+        return
+
+    try:
+        report.grade(smart_score_threshold=st.session_state.smart_score_threshold)
+    except ZeroDivisionError:
+        # A zero threshold cannot be graded; ask for a regrade once it changes
+        st.session_state.is_graded = False
@@ -1,15 +1,30 @@
+from typing import TYPE_CHECKING
+
 import streamlit as st
 
-from ixl_grader.core.report import Report
-from ixl_grader.ui.session.updater import session_updater
+from ixl_grader.ui.session.updater import session_callback, session_updater
+
+if TYPE_CHECKING:
+    # The grading core loads pandas, so it is only imported once a report is created
+    from ixl_grader.core.report import Report
 
 
-def get_report() -> Report:
+def get_report() -> "Report":
     """Get the current Report object from session state"""
     return st.session_state.report
 
 
 @session_updater
-def set_report(report: Report):
+def set_report(report: "Report"):
     """Set the Report object in session state"""
     st.session_state.report = report
+
+
+@session_callback
+def prepare_report_download():
+    """Build the graded results export so the next run can offer it for download.
+
+    The report keeps the export until it is regraded, so this is only clicked again
+    after the grades change.
+    """
+    st.session_state.report.export_bytes()
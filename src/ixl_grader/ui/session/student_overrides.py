@@ -1,33 +1,85 @@
-import tempfile
 import streamlit as st
 
-from ixl_grader.ui.session.updater import session_updater
+from ixl_grader.ui.session.updater import session_callback, session_updater
+from ixl_grader.ui.session.grade import refresh_grades
 from ixl_grader.ui.session.report import get_report
 
 
+@session_callback
+def handle_overrides_uploader_change():
+    """Handle a new file chosen in the student overrides file uploader"""
+    uploaded_file = st.session_state.overrides_uploader
+    if uploaded_file is not None and uploaded_file != get_uploaded_overrides_file():
+        handle_student_overrides_upload(uploaded_file=uploaded_file)
+        # Hide uploader after successful selection to keep UI clean
+        st.session_state["show_overrides_uploader"] = False
+
+
+@session_callback
+def handle_override_form_submit():
+    """Set the individual override entered in the student override form"""
+    student_id = st.session_state.override_student_id
+    if not student_id:
+        set_overrides_notice("error", "Please enter a Student ID")
+        return
+
+    report = get_report()
+    if report is None:
+        # Create a temporary report just for override management
+        from ixl_grader.core.report import Report
+        from ixl_grader.ui.session.report import set_report
+        report = Report()
+        set_report(report)
+
+    # Convert None values appropriately
+    custom_threshold = st.session_state.override_threshold
+    minimum_grade = st.session_state.override_minimum
+    report.set_student_override(
+        student_id=student_id,
+        smart_score_threshold=custom_threshold if custom_threshold != 0 else None,
+        minimum_grade=minimum_grade if minimum_grade != 0 else None,
+    )
+    refresh_grades()
+
+    set_overrides_notice("success", f"✅ Override set for student {student_id}")
+
+
+def set_overrides_notice(kind: str, message: str):
+    """Show a message in the student overrides section on its next render.
+
+    kind is the name of the Streamlit element used to show it, e.g. "success" or "error".
+    """
+    st.session_state.overrides_notice = (kind, message)
+
+
+def pop_overrides_notice():
+    """Get and clear the pending student overrides message, as (kind, message) or None"""
+    notice = st.session_state.overrides_notice
+    st.session_state.overrides_notice = None
+    return notice
+
+
 @session_updater
 def handle_student_overrides_upload(uploaded_file):
     """Handle student overrides file upload and update session state"""
     
     try:
-        # Save the uploaded file to disk
-        with tempfile.NamedTemporaryFile(delete=True) as tmp_file:
-            tmp_file.write(uploaded_file.getvalue())
-            tmp_file.flush()
-            
-            # Import overrides - create report if needed
-            report = get_report()
-            if report is None:
-                # Create a temporary report just for override management
-                from ixl_grader.core.report import Report
-                from ixl_grader.ui.session.report import set_report
-                report = Report()
-                set_report(report)
-            
-            report.import_student_overrides(csv_path=tmp_file.name)
+        # Import overrides - create report if needed
+        report = get_report()
+        if report is None:
+            # Create a temporary report just for override management
+            from ixl_grader.core.report import Report
+            from ixl_grader.ui.session.report import set_report
+            report = Report()
+            set_report(report)
+        
+        # The upload is parsed in memory without touching disk
+        report.import_student_overrides(uploaded_file.getvalue())
+        refresh_grades()
                 
     except Exception as e:
-        st.error(f"❌ Error uploading student overrides file: {str(e)}")
+        # Shown in the overrides section, since this may run in a widget callback
+        set_overrides_notice("error", f"❌ Error uploading student overrides file: {str(e)}")
         return
     
     # Store the uploaded overrides file in session state for UI feedback
@@ -44,6 +96,22 @@ def get_uploaded_overrides_file():
     return getattr(st.session_state, 'uploaded_overrides_file', None)
 
 
+def get_student_overrides():
+    """Get the overrides manager to preview, even before a report exists.
+
+    Without a report, overrides are read from local storage through a manager kept
+    for the session, so its preview pages stay cached between reruns.
+    """
+    report = get_report()
+    if report is not None:
+        return report.get_student_overrides()
+
+    if st.session_state.get("preview_overrides") is None:
+        from ixl_grader.core.student_overrides import StudentOverrides
+        st.session_state.preview_overrides = StudentOverrides()
+    return st.session_state.preview_overrides
+
+
 def has_student_overrides() -> bool:
     """Check if student overrides are loaded (from persistent storage or session)"""
     # Check if we have a report with overrides loaded
@@ -58,6 +126,7 @@ def has_student_overrides() -> bool:
     return local_storage.has_student_overrides()
 
 
+@session_callback
 def clear_student_overrides():
     """Clear all student overrides from persistent storage"""
     # Create a report if none exists to access the overrides manager
@@ -69,6 +138,7 @@ def clear_student_overrides():
         set_report(report)
     
     report.get_student_overrides().clear_all_overrides()
+    refresh_grades()
     
     
     # Also clear from session state
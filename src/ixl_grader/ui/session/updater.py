@@ -1,12 +1,127 @@
+import functools
+import threading
+import time
+
 import streamlit as st
 
 
+# Session state keys for bookkeeping that never needs a rerun of its own
+_RENDER_STATS_KEY = "render_stats"
+_RERUN_REQUESTED_KEY = "rerun_requested"
+_UNTRACKED_KEYS = {_RENDER_STATS_KEY, _RERUN_REQUESTED_KEY}
+
+_callback_state = threading.local()
+
+
 def session_updater(func):
-    """Decorator to update session state after function execution"""
+    """Decorator to update session state after function execution.
 
+    Updates made from a widget callback are drawn by the script run that follows, so
+    nothing more is needed. Otherwise the app is rerun, but only if the update
+    actually changed session state.
+    """
+
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
+        if _in_callback():
+            return func(*args, **kwargs)
+
+        before = _snapshot_session_state()
         result = func(*args, **kwargs)
-        st.rerun()
+        if _session_state_changed(before, _snapshot_session_state()):
+            st.session_state[_RERUN_REQUESTED_KEY] = True
+            st.rerun()
         return result
 
     return wrapper
+
+
+def session_callback(func):
+    """Decorator for functions passed to a widget's on_change or on_click.
+
+    Streamlit runs callbacks before the script, so session updates made inside them
+    are drawn in a single run without calling st.rerun.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        _callback_state.depth = getattr(_callback_state, "depth", 0) + 1
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _callback_state.depth -= 1
+
+    return wrapper
+
+
+def track_render(render):
+    """Decorator counting script runs and render time per user interaction.
+
+    Runs started by session_updater's reruns count toward the interaction that
+    caused them. The counters are available from get_render_stats.
+    """
+
+    @functools.wraps(render)
+    def wrapper(*args, **kwargs):
+        stats = st.session_state.setdefault(
+            _RENDER_STATS_KEY,
+            {
+                "interactions": 0,
+                "runs": 0,
+                "reruns": 0,
+                "last_interaction_runs": 0,
+                "last_interaction_seconds": 0.0,
+            },
+        )
+        if st.session_state.pop(_RERUN_REQUESTED_KEY, False):
+            stats["reruns"] += 1
+        else:
+            stats["interactions"] += 1
+            stats["last_interaction_runs"] = 0
+            stats["last_interaction_seconds"] = 0.0
+        stats["runs"] += 1
+        stats["last_interaction_runs"] += 1
+
+        start = time.perf_counter()
+        try:
+            return render(*args, **kwargs)
+        finally:
+            stats["last_interaction_seconds"] += time.perf_counter() - start
+
+    return wrapper
+
+
+def get_render_stats() -> dict:
+    """Get the script run and render time counters for this session.
+
+    Keys: interactions, runs, reruns, last_interaction_runs and
+    last_interaction_seconds.
+    """
+    return dict(st.session_state.get(_RENDER_STATS_KEY, {}))
+
+
+def _in_callback() -> bool:
+    return getattr(_callback_state, "depth", 0) > 0
+
+
+def _snapshot_session_state() -> dict:
+    return {
+        key: value
+        for key, value in st.session_state.items()
+        if key not in _UNTRACKED_KEYS
+    }
+
+
+def _session_state_changed(before: dict, after: dict) -> bool:
+    if before.keys() != after.keys():
+        return True
+    return any(not _same_value(before[key], after[key]) for key in after)
+
+
+def _same_value(a, b) -> bool:
+    # Objects such as reports are compared by identity; plain values by equality
+    if a is b:
+        return True
+    if isinstance(a, (bool, int, float, str)) and type(a) is type(b):
+        return a == b
+    return False
@@ -0,0 +1,38 @@
+import pandas as pd
+import pytest
+
+from ixl_grader.core.override_store import SharedOverrideStore
+from ixl_grader.core.persistence import LocalStorage, SQLiteLocalStorage
+
+
+def override_row(student_id, minimum_grade):
+    return pd.DataFrame({
+        "Student ID": [student_id],
+        "Smart Score Threshold": [float("nan")],
+        "Minimum Grade": [minimum_grade],
+    })
+
+
+@pytest.mark.parametrize("storage_class", [LocalStorage, SQLiteLocalStorage])
+def test_store_picks_up_overrides_saved_by_another_process(tmp_path, storage_class):
+    # Each process has its own store over the same storage directory
+    writer = SharedOverrideStore(storage_class(tmp_path))
+    reader = SharedOverrideStore(storage_class(tmp_path))
+    changes = []
+    reader.subscribe(lambda version, changed_ids: changes.append(changed_ids))
+    assert reader.snapshot()[1] is None
+
+    # Saves close together can leave the file's mtime and size unchanged
+    for minimum_grade in range(20):
+        writer.update(override_row("1", minimum_grade))
+        assert reader.snapshot()[1]["Minimum Grade"].tolist() == [minimum_grade]
+    assert changes == [None] * 20
+
+    # Reading again, or reading the store's own saves, does not reload
+    reader.snapshot()
+    reader.update(override_row("2", 80))
+    assert changes == [None] * 20 + [{"2"}]
+    assert writer.snapshot()[1]["Student ID"].tolist() == ["1", "2"]
+
+    writer.replace(None)
+    assert reader.snapshot()[1] is None
@@ -0,0 +1,120 @@
+import io
+
+import pandas as pd
+import pytest
+
+from ixl_grader.core.parsing import HAS_PYARROW
+from ixl_grader.core.report import Report
+from ixl_grader.core.student_overrides import StudentOverrides
+
+REPORT_CSV = (
+    "Student ID,Last name,First name,Skill,SmartScore\n"
+    "00123,Smith,Olivia,A.1 Skill 1,40\n"
+    "00123,Smith,Olivia,A.2 Skill 2,95\n"
+    "ID00456,Jones,Liam,A.1 Skill 1,40\n"
+    "789,Brown,Emma,A.1 Skill 1,40\n"
+)
+
+# Every Student ID looks like a number, so inferring their type would drop the zeros
+OVERRIDES_CSV = (
+    "Student ID,Smart Score Threshold,Minimum Grade\n"
+    "00123,,90\n"
+    "00456,,80\n"
+)
+
+ENGINES = ["c", "pyarrow"] if HAS_PYARROW else ["c"]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_padded_student_ids_match_overrides_in_stream_and_memory(tmp_path, engine):
+    report_path = tmp_path / "report.csv"
+    report_path.write_text(REPORT_CSV, encoding="utf-8")
+
+    overrides = StudentOverrides(persist=False)
+    overrides.import_overrides(OVERRIDES_CSV.encode("utf-8"))
+    report = Report(student_overrides=overrides, parser_engine=engine)
+
+    report.import_report(str(report_path))
+    report.grade(80)
+    in_memory = io.StringIO()
+    report.export_report(in_memory)
+
+    streamed = io.StringIO()
+    report.grade_stream(report_path, streamed, 80)
+
+    assert streamed.getvalue() == in_memory.getvalue()
+    assert in_memory.getvalue().splitlines()[1:] == [
+        "00123,Smith,Olivia,40,90.0",
+        "00123,Smith,Olivia,95,100.0",
+        "00456,Jones,Liam,40,80.0",
+        "789,Brown,Emma,40,50.0",
+    ]
+
+
+def test_failed_regrade_keeps_override_changes_pending():
+    overrides = StudentOverrides(persist=False)
+    report = Report(student_overrides=overrides)
+    report.import_report(REPORT_CSV.encode("utf-8"))
+    report.grade(80)
+
+    overrides.set_override("789", 50)
+    overrides.set_override("00123", 0)
+    with pytest.raises(ZeroDivisionError):
+        report.grade(80)
+
+    # Fixing one student must still regrade the other change from the failed grade
+    overrides.set_override("00123", 80)
+    report.grade(80)
+    assert report.get_df()["Score"].tolist() == [50.0, 100.0, 50.0, 80.0]
+
+
+def test_view_rejects_writes_to_every_column():
+    report = Report(student_overrides=StudentOverrides(persist=False))
+    report.import_report(REPORT_CSV.encode("utf-8"))
+    report.grade(80)
+    expected = report.get_df()
+
+    view = report.view()
+    for position, column in enumerate(view.columns):
+        with pytest.raises(ValueError, match="read-only"):
+            view.iloc[0, position] = view[column].iloc[1]
+
+    pd.testing.assert_frame_equal(report.get_df(), expected)
+
+
+def test_grades_with_missing_smart_scores():
+    overrides = StudentOverrides(persist=False)
+    report = Report(student_overrides=overrides)
+    report.import_report(
+        b"Student ID,Last name,First name,Skill,SmartScore\n"
+        b"1,Smith,Olivia,A.1 Skill 1,40\n"
+        b"1,Smith,Olivia,A.2 Skill 2,\n"
+        b"2,Jones,Liam,A.1 Skill 1,33\n"
+        b"3,Brown,Emma,A.1 Skill 1,90\n"
+        b"4,Davis,Ava,A.1 Skill 1,\n"
+    )
+    overrides.set_override("2", 66.5)
+    overrides.set_override("4", minimum_grade=60)
+    report.grade(80)
+
+    # Missing SmartScores stay ungraded, even with a minimum grade
+    scores = report.get_df()["Score"].tolist()
+    assert scores[0] == 50.0 and scores[2] == 50.0 and scores[3] == 100.0
+    assert pd.isna(scores[1]) and pd.isna(scores[4])
+
+
+def test_stray_quote_in_name_does_not_stop_repairs():
+    report = Report(student_overrides=StudentOverrides(persist=False))
+    # The quote in O"Neil is text to the CSV parser, not the start of a quoted field
+    report.import_report(
+        b"Student ID,Last name,First name,Skill,SmartScore\n"
+        b'1,O"Neil,,Ann,A.1 Skill 1,50\n'
+        b"2,Smith,,Bob,A.1 Skill 1,60\n"
+        b'3,"Lee, Jr.",Kim,A.1 Skill 1,70\n'
+    )
+
+    assert report.get_rows_repaired() == 2
+    df = report.get_df()
+    assert df["Last name"].tolist() == ['O"Neil ', "Smith ", "Lee, Jr."]
+    assert df["First name"].tolist() == ["Ann", "Bob", "Kim"]
+    assert df["SmartScore"].tolist() == [50, 60, 70]